@@ -1,10 +1,15 @@
+import asyncio
+import itertools
 import logging
+import operator
 import re
+import weakref
 import telegram.error
 from sqlalchemy.orm.exc import DetachedInstanceError
-from typing import NoReturn
+from typing import Any, Awaitable, Callable, Coroutine, NoReturn
 from telegram import (
     KeyboardButton,
+    Message,
     Update,
     InlineKeyboardButton,
     InlineKeyboardMarkup,
@@ -12,7 +17,10 @@ from telegram import (
     ReplyKeyboardMarkup,
 )
 from telegram.ext import (
+    AIORateLimiter,
+    Application,
     ApplicationBuilder,
+    BaseUpdateProcessor,
     CommandHandler,
     CallbackQueryHandler,
     CallbackContext,
@@ -26,8 +34,8 @@ from sqlalchemy.orm import sessionmaker
 from models.google_services import GoogleDrive, GoogleMap
 from models.telegram_user import TelegramUser
 from models.notification import NotificationSender
-from core.db_functions import find_company_by_name, get_place_by_id
-from core.db import engine, get_db
+from core.db_functions import find_company_by_name, get_place_by_id, invalidate_place
+from core.db import POOL_SIZE, engine, get_db
 from core.model import ModelPlaceCard
 
 # Configure logging
@@ -36,6 +44,191 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Input validation, patterns are compiled once at import
+_NAME_RE = re.compile(r"^[a-zA-Z0-9\s.,:;!?'-]+$")
+_GMAPS_PREFIX = "https://maps.app.goo.gl/"
+_NON_DIGITS_RE = re.compile(r"[^0-9]+")
+
+# Company types allowed in the "Type" column
+_VALID_TYPES: frozenset[str] = frozenset(("Places to eat", "Adventures", "Services"))
+
+# Callback data routed to TelegramBot.button: editable fields and company types
+_BUTTON_DATA: frozenset[str] = _VALID_TYPES | frozenset(
+    (
+        "Name",
+        "type",
+        "google_map",
+        "phone_number",
+        "whatsapp",
+        "manager_phone_number",
+        "hours_of_operation",
+    )
+)
+_PAGE_BUTTONS: frozenset[str] = frozenset(("page_next", "page_prev"))
+# Callback data prefix of a place button in the search results, followed by the place ID
+_PLACE_PREFIX = "notion_"
+
+
+def _is_page_button(data: str) -> bool:
+    """Matches the search result buttons: notion_<id>, page_next and page_prev."""
+    if data in _PAGE_BUTTONS:
+        return True
+    if not data.startswith(_PLACE_PREFIX):
+        return False
+    place_id = data.removeprefix(_PLACE_PREFIX)
+    return place_id.isascii() and place_id.isdigit()
+
+
+# Places shown per page of the radius search results
+_LEN_LIST = 3
+
+# Photos uploaded to Google Drive at once
+_DRIVE_UPLOADS = 8
+
+# Place card columns edited by managers and sent in notifications
+_CARD_COLS = (
+    "ID",
+    "Name",
+    "type",
+    "photo",
+    "location",
+    "google_map",
+    "phone_number",
+    "whatsapp",
+    "manager_phone_number",
+    "hours_of_operation",
+)
+_card_getter = operator.attrgetter(*_CARD_COLS)
+
+# Static keyboards, built once and shared between updates
+_START_MARKUP = InlineKeyboardMarkup(
+    [
+        [InlineKeyboardButton("Show place card", callback_data="button_add_pressed")],
+        [
+            InlineKeyboardButton(
+                "Show unfilled places", callback_data="show_unfilled_places"
+            )
+        ],
+    ]
+)
+
+_TYPE_MARKUP = InlineKeyboardMarkup(
+    [
+        [InlineKeyboardButton("Places to eat", callback_data="Places to eat")],
+        [InlineKeyboardButton("Adventures", callback_data="Adventures")],
+        [InlineKeyboardButton("Services", callback_data="Services")],
+    ]
+)
+
+# Navigation rows under the radius search results
+_PAGE_NAV_ROW = (
+    InlineKeyboardButton(text="<", callback_data="page_prev"),
+    InlineKeyboardButton(text=">", callback_data="page_next"),
+)
+_EXIT_LOCATION_ROW = (InlineKeyboardButton(text="Exit", callback_data="exit_location"),)
+
+# Edit bar buttons as (text, callback_data), laid out two per row
+_EDIT_FIELDS = (
+    ("Name", "Name"),
+    ("Type", "type"),
+    ("Photos", "photo"),
+    ("Google map", "google_map"),
+    ("Phone numbers", "phone_number"),
+    ("WhatsApp Number", "whatsapp"),
+    ("Manager Phone Number", "manager_phone_number"),
+    ("Hours of operation", "hours_of_operation"),
+)
+
+_EDIT_BAR_MARKUP = InlineKeyboardMarkup(
+    [
+        [
+            InlineKeyboardButton(text, callback_data=data)
+            for text, data in _EDIT_FIELDS[i : i + 2]
+        ]
+        for i in range(0, len(_EDIT_FIELDS), 2)
+    ]
+)
+
+_EDIT_PLACE_MARKUP = InlineKeyboardMarkup(
+    [[InlineKeyboardButton("Edit", callback_data="edit_place_card")]]
+)
+
+_PHOTO_FILTER_MARKUP = InlineKeyboardMarkup(
+    [
+        [
+            InlineKeyboardButton(text="With photos", callback_data="photo_true"),
+            InlineKeyboardButton(text="Without photos", callback_data="photo_false"),
+        ]
+    ]
+)
+
+_SAVE_EXIT_MARKUP = ReplyKeyboardMarkup(
+    [["Exit", "Save"]], resize_keyboard=True, one_time_keyboard=True
+)
+
+_SHARE_LOCATION_MARKUP = ReplyKeyboardMarkup(
+    [[KeyboardButton(text="Share your location", request_location=True)], ["Exit"]],
+    resize_keyboard=True,
+    one_time_keyboard=True,
+)
+
+
+# Updates accepted at once by PerChatUpdateProcessor, including those waiting on their chat
+_MAX_QUEUED_UPDATES = 4096
+
+
+class PerChatUpdateProcessor(BaseUpdateProcessor):
+    """
+    Processes updates of different chats concurrently and updates of one chat in order.
+
+    Conversation steps of a user read and write the same user_data, so they must not
+    interleave. A chat's lock lives only while its updates are queued or running.
+
+    The limit of running updates is applied after the chat lock is taken, so updates
+    queued behind a busy chat do not hold slots other chats could use. The semaphore of
+    BaseUpdateProcessor, taken before do_process_update, only bounds queued updates.
+
+    Attributes:
+        _chat_locks (weakref.WeakValueDictionary): Locks of the chats with updates in flight.
+        _running (asyncio.Semaphore): Slots for updates being processed.
+    """
+
+    def __init__(self, max_concurrent_updates: int) -> None:
+        super().__init__(_MAX_QUEUED_UPDATES)
+        self._running = asyncio.Semaphore(max_concurrent_updates)
+        self._chat_locks: weakref.WeakValueDictionary[int, asyncio.Lock] = (
+            weakref.WeakValueDictionary()
+        )
+
+    async def do_process_update(
+        self, update: object, coroutine: Awaitable[Any]
+    ) -> None:
+        """
+        Awaits the update's coroutine under the lock of its chat and a running slot.
+
+        Args:
+            update (object): The update to be processed.
+            coroutine (Awaitable[Any]): The coroutine processing the update.
+        """
+        chat = update.effective_chat if isinstance(update, Update) else None
+        if chat is None:
+            async with self._running:
+                await coroutine
+            return
+
+        # The local reference keeps the lock alive for every waiter of this chat
+        lock = self._chat_locks.get(chat.id)
+        if lock is None:
+            lock = self._chat_locks[chat.id] = asyncio.Lock()
+        async with lock, self._running:
+            await coroutine
+
+    async def initialize(self) -> None:
+        pass
+
+    async def shutdown(self) -> None:
+        pass
+
 
 class TelegramBot:
     """
@@ -59,7 +252,64 @@ class TelegramBot:
         self.token = token
         self.current_card_id = None
         self.field_to_update = None
-        self.application = ApplicationBuilder().token(token).build()
+        self._notification_sender = NotificationSender(token=token)
+        self._maps = GoogleMap()
+        # Long-running coroutines started on the bot's event loop, e.g. the Notion sync
+        self._background_jobs: list[Callable[[], Coroutine[Any, Any, Any]]] = []
+        self._background_tasks: list[asyncio.Task] = []
+        # Editable fields mapped to their validators/normalizers
+        self._field_handlers = {
+            "Name": self._parse_name,
+            "type": self._parse_type,
+            "photo": self._parse_photos,
+            "google_map": self._parse_google_map,
+            "phone_number": self._parse_phone,
+            "whatsapp": self._parse_phone,
+            "manager_phone_number": self._parse_phone,
+            "hours_of_operation": self._parse_text,
+        }
+        # Updates processed at once, sized to the DB connection pool
+        self.application = (
+            ApplicationBuilder()
+            .token(token)
+            .concurrent_updates(PerChatUpdateProcessor(POOL_SIZE))
+            .rate_limiter(AIORateLimiter())
+            .post_init(self._post_init)
+            .post_shutdown(self._post_shutdown)
+            .build()
+        )
+
+    def run_alongside(self, job: Callable[[], Coroutine[Any, Any, Any]]) -> None:
+        """
+        Registers a coroutine function to run on the bot's event loop while it polls.
+
+        Args:
+            job (Callable[[], Coroutine]): Called once on startup, cancelled on shutdown.
+        """
+        self._background_jobs.append(job)
+
+    async def _post_init(self, application: Application) -> None:
+        """
+        Starts the registered background jobs once the application is initialized.
+
+        Args:
+            application (Application): The application instance being started.
+        """
+        self._background_tasks = [
+            asyncio.create_task(job()) for job in self._background_jobs
+        ]
+
+    async def _post_shutdown(self, application: Application) -> None:
+        """
+        Releases resources held by the bot when the application stops.
+
+        Args:
+            application (Application): The application instance being shut down.
+        """
+        for task in self._background_tasks:
+            task.cancel()
+        await asyncio.gather(*self._background_tasks, return_exceptions=True)
+        await self._notification_sender.close()
 
     def validate_name(self, name: str) -> bool:
         """
@@ -71,7 +321,7 @@ class TelegramBot:
         Returns:
             bool: True if the name is valid, False otherwise.
         """
-        return bool(re.match(r"^[a-zA-Z0-9\s.,:;!?'-]+$", name))
+        return _NAME_RE.match(name) is not None
 
     def validate_type(self, type: str) -> bool:
         """
@@ -83,8 +333,7 @@ class TelegramBot:
         Returns:
             bool: True if the type is valid, False otherwise.
         """
-        valid_types = ["Places to eat", "Adventures", "Services"]
-        return type in valid_types
+        return type in _VALID_TYPES
 
     def validate_photos(self, photos: list) -> bool:
         """
@@ -110,7 +359,132 @@ class TelegramBot:
         Returns:
             bool: True if the URL is valid, False otherwise.
         """
-        return bool(re.match(r"^https:\/\/maps\.app\.goo\.gl\/[a-zA-Z0-9]+$", url))
+        if not url.startswith(_GMAPS_PREFIX):
+            return False
+        location_id = url[len(_GMAPS_PREFIX) :]
+        return location_id.isascii() and location_id.isalnum()
+
+    def _parse_name(self, value: str, update: Update) -> tuple[Any, tuple | None]:
+        """
+        Parses a new place name, rejecting names that fail validate_name.
+
+        Args:
+            value (str): The text entered by the user.
+            update (Update): The update object containing the incoming update.
+
+        Returns:
+            tuple: The value to store and None, or None and an error as (text, reply_markup).
+        """
+        if not self.validate_name(value):
+            return None, (
+                "Invalid name. Please enter a valid name with only letters, spaces, and apostrophes.",
+                None,
+            )
+        return value, None
+
+    def _parse_type(self, value: str, update: Update) -> tuple[Any, tuple | None]:
+        """
+        Parses a new place type, replying with the type picker when it is unknown.
+
+        Args:
+            value (str): The text entered by the user.
+            update (Update): The update object containing the incoming update.
+
+        Returns:
+            tuple: The value to store and None, or None and an error as (text, reply_markup).
+        """
+        if not self.validate_type(value):
+            return None, (
+                "Invalid type. Please choose one of the following types:",
+                _TYPE_MARKUP,
+            )
+        return value, None
+
+    def _parse_photos(self, value: str, update: Update) -> tuple[Any, tuple | None]:
+        """
+        Takes the photos attached to the message instead of the entered text.
+
+        Args:
+            value (str): The text entered by the user.
+            update (Update): The update object containing the incoming update.
+
+        Returns:
+            tuple: The value to store and None, or None and an error as (text, reply_markup).
+        """
+        # Photos are handled separately in another method
+        photos = update.message.photo
+        if not photos or not self.validate_photos(photos):
+            return None, ("Invalid photos. Please send valid photo files.", None)
+        return photos, None  # Update with the actual photo list
+
+    def _parse_google_map(self, value: str, update: Update) -> tuple[Any, tuple | None]:
+        """
+        Parses a new Google Maps link, rejecting links in another format.
+
+        Args:
+            value (str): The text entered by the user.
+            update (Update): The update object containing the incoming update.
+
+        Returns:
+            tuple: The value to store and None, or None and an error as (text, reply_markup).
+        """
+        if not self.validate_google_maps(value):
+            return None, (
+                "Invalid input for google_map. Provide a link to Google Maps using the following format https://maps.app.goo.gl/{LocationID}.",
+                None,
+            )
+        return value, None
+
+    def _parse_phone(self, value: str, update: Update) -> tuple[Any, tuple | None]:
+        """
+        Normalizes a phone number, adding the +506 country code to local numbers.
+
+        Args:
+            value (str): The text entered by the user.
+            update (Update): The update object containing the incoming update.
+
+        Returns:
+            tuple: The value to store and None, or None and an error as (text, reply_markup).
+        """
+        digits_only = _NON_DIGITS_RE.sub("", value)
+        if len(digits_only) == 8:
+            return "+506" + digits_only, None
+        if len(digits_only) == 11 and digits_only.startswith("506"):
+            return "+" + digits_only, None
+        return digits_only, None
+
+    def _parse_text(self, value: str, update: Update) -> tuple[Any, tuple | None]:
+        """
+        Stores free text, e.g. hours of operation, as entered.
+
+        Args:
+            value (str): The text entered by the user.
+            update (Update): The update object containing the incoming update.
+
+        Returns:
+            tuple: The value to store and None, or None and an error as (text, reply_markup).
+        """
+        return value, None
+
+    async def _say(
+        self,
+        update: Update,
+        context: ContextTypes.DEFAULT_TYPE,
+        text: str,
+        **kwargs: Any,
+    ) -> Message:
+        """
+        Sends a text message to the chat of the update.
+
+        Args:
+            update (Update): The update object containing the incoming update.
+            context (ContextTypes.DEFAULT_TYPE): The context from the update.
+            text (str): Message text.
+            **kwargs: Extra send_message arguments, e.g. reply_markup.
+        """
+        return await context.bot.send_message(
+            chat_id=update.effective_chat.id, text=text, **kwargs
+        )
 
     async def start(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """
@@ -125,28 +499,14 @@ class TelegramBot:
         user = TelegramUser.auth(user_id)
 
         if user:
-            logger.info(f"Authenticated user ID: {user_id}, Role: {user.role}")
-
-            button_begin = InlineKeyboardButton(
-                text="Show place card", callback_data="button_add_pressed"
-            )
+            logger.info("Authenticated user ID: %s, Role: %s", user_id, user.role)
 
-            show_unfilled_button = InlineKeyboardButton(
-                text="Show unfilled places", callback_data="show_unfilled_places"
-            )
-
-            keyboard = InlineKeyboardMarkup([[button_begin], [show_unfilled_button]])
-
-            await context.bot.send_message(
-                chat_id=update.effective_chat.id,
-                text="Hi! Choose an action:",
-                reply_markup=keyboard,
+            await self._say(
+                update, context, "Hi! Choose an action:", reply_markup=_START_MARKUP
             )
         else:
-            await context.bot.send_message(
-                chat_id=update.effective_chat.id, text="Your ID is not authorized"
-            )
-            logger.warning(f"Unauthorized ID: {user_id}")
+            await self._say(update, context, "Your ID is not authorized")
+            logger.warning("Unauthorized ID: %s", user_id)
 
     async def button_handler(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
@@ -164,7 +524,7 @@ class TelegramBot:
         await query.answer()  # unlock the button
 
         if query.data == "button_add_pressed":
-            logger.info(f"Processed {query.data} from user {query.from_user.id}")
+            logger.info("Processed %s from user %s", query.data, query.from_user.id)
             await self.add_company(context, update)
 
     async def show_unfilled_places(
@@ -181,22 +541,12 @@ class TelegramBot:
         """
         logger.info("Showing unfilled places")
 
-        # Define the keyboard with a button to request location and an Exit button
-        location_button = KeyboardButton(
-            text="Share your location", request_location=True
-        )
-        keyboard = [[location_button], ["Exit"]]
-
-        # Create the ReplyKeyboardMarkup
-        reply_markup = ReplyKeyboardMarkup(
-            keyboard, resize_keyboard=True, one_time_keyboard=True
-        )
-
-        # Send the message with the custom keyboard
-        await context.bot.send_message(
-            chat_id=update.effective_chat.id,
-            text="Please share your location to find unfilled places near you:",
-            reply_markup=reply_markup,
+        # Send the message with the location request and Exit buttons
+        await self._say(
+            update,
+            context,
+            "Please share your location to find unfilled places near you:",
+            reply_markup=_SHARE_LOCATION_MARKUP,
         )
 
     async def add_company(
@@ -211,25 +561,52 @@ class TelegramBot:
         """
         logger.info("Adding company")
 
-        await context.bot.send_message(
-            chat_id=update.effective_chat.id,
-            text="Please enter the name of the company you want to know about.",
+        await self._say(
+            update,
+            context,
+            "Please enter the name of the company you want to know about.",
             reply_markup=ForceReply(selective=True),
         )
 
     def dict_to_place_card(self, data: dict) -> ModelPlaceCard:
-        return ModelPlaceCard(
-            Name=data.get("Name", ""),
-            ID=data.get("ID", ""),
-            type=data.get("type", ""),
-            photo=data.get("photo", ""),
-            location=data.get("location", ""),
-            google_map=data.get("google_map", ""),
-            phone_number=data.get("phone_number", ""),
-            whatsapp=data.get("whatsapp", ""),
-            manager_phone_number=data.get("manager_phone_number", ""),
-            hours_of_operation=data.get("hours_of_operation", ""),
-        )
+        return ModelPlaceCard(**{col: data.get(col, "") for col in _CARD_COLS})
+
+    def _lookup_or_create(self, name: str) -> tuple[list[ModelPlaceCard], bool]:
+        """
+        Finds companies by name and creates a new one if none exists.
+        Blocking, runs in a worker thread.
+
+        Args:
+            name (str): The company name to look up.
+
+        Returns:
+            tuple[list[ModelPlaceCard], bool]: Found companies and whether a new one was created.
+             When several companies share the name, only the ID, Name, location and type
+             columns are loaded for them.
+        """
+        with get_db() as session:
+            # Two rows are enough to tell a unique name from an ambiguous one
+            companies = (
+                session.query(ModelPlaceCard).filter_by(Name=name).limit(2).all()
+            )
+            if len(companies) > 1:
+                companies = (
+                    session.query(
+                        ModelPlaceCard.ID,
+                        ModelPlaceCard.Name,
+                        ModelPlaceCard.location,
+                        ModelPlaceCard.type,
+                    )
+                    .filter(ModelPlaceCard.Name == name)
+                    .all()
+                )
+            if companies:
+                return companies, False
+
+            company = ModelPlaceCard(Name=name)
+            session.add(company)
+            session.commit()
+            return [company], True
 
     async def handle_company_name(
         self, update: Update, context: CallbackContext
@@ -243,23 +620,25 @@ class TelegramBot:
         """
         logger.info("Handling company name")
         company_name = update.message.text
-        logging.info(f"Company name received: {company_name}")
+        logger.info("Company name received: %s", company_name)
 
         # Validate company name
         if not self.validate_name(company_name):
-            await context.bot.send_message(
-                chat_id=update.effective_chat.id,
-                text="Invalid name. Please enter a valid name with only letters, spaces, numbers and punctuation marks.",
+            await self._say(
+                update,
+                context,
+                "Invalid name. Please enter a valid name with only letters, spaces, numbers and punctuation marks.",
                 reply_markup=ForceReply(selective=True),
             )
             # Request the user to re-enter the company name
             await self.add_company(context, update)
             return  # Exit the function to wait for another input
 
-        with get_db() as session:
-            companies = session.query(ModelPlaceCard).filter_by(Name=company_name).all()
+        companies, created = await asyncio.to_thread(
+            self._lookup_or_create, company_name
+        )
 
-        if companies and len(companies) > 1:
+        if len(companies) > 1:
             keyboard = []
             for company in companies:
                 callback_data = f"select_company_{company.ID}"
@@ -275,28 +654,16 @@ class TelegramBot:
                 )
             reply_markup = InlineKeyboardMarkup(keyboard)
             message = "Multiple companies found with the same name. Please select one:"
-            await context.bot.send_message(
-                chat_id=update.effective_chat.id,
-                text=message,
-                reply_markup=reply_markup,
-            )
+            await self._say(update, context, message, reply_markup=reply_markup)
             logger.info("Multiple companies found")
         else:
-            if companies:
-                company = companies[0]
-                context.user_data["current_card"] = companies[0]
-                message = "Company found."
-            else:
-                with get_db() as session:
-                    company = ModelPlaceCard(Name=company_name)
-                    session.add(company)
-                    session.commit()
-                    session.refresh(company)
-                context.user_data["current_card"] = company
+            company = companies[0]
+            context.user_data["current_card"] = company
+            if created:
                 message = "Company not found. A new one was created."
-            await context.bot.send_message(
-                chat_id=update.effective_chat.id, text=message
-            )
+            else:
+                message = "Company found."
+            await self._say(update, context, message)
             await self._show_place(update=update, context=context, company=company)
 
     async def select_company(self, update: Update, context: CallbackContext) -> None:
@@ -312,25 +679,21 @@ class TelegramBot:
             query = update.callback_query
             await query.answer()
 
-            logger.info(f"Callback data: {query.data}")
             company_id = int(query.data.split("_")[-1])
-            logger.info(f"Extracted company ID: {company_id}")
+            logger.info("Callback data: %s, company ID: %s", query.data, company_id)
 
-            with get_db() as session:
-                company = session.query(ModelPlaceCard).filter_by(ID=company_id).first()
+            company = await asyncio.to_thread(get_place_by_id, company_id)
 
             if company:
                 context.user_data["current_card"] = company
 
-                # Delete message with selection buttons
-                await query.delete_message()
-
+                # Selection message is replaced by the place card
                 await self._show_place(update=update, context=context, company=company)
             else:
                 await query.edit_message_text(text="Error: Company not found.")
 
         except Exception as e:
-            logger.error(f"Error in select_company: {e}", exc_info=True)
+            logger.error("Error in select_company: %s", e, exc_info=True)
             await update.effective_chat.send_message(
                 "An error occurred while processing your selection."
             )
@@ -338,10 +701,45 @@ class TelegramBot:
     async def _show_place(
         self, context: CallbackContext, update: Update, company: ModelPlaceCard
     ) -> None:
-        await self.show_place_card(update=update, context=context, company=company)
-        await self.show_editbar(update=update, context=context)
+        """
+        Shows the place card together with the edit bar in one message, editing the
+        message in place when called from a callback query, and the Save/Exit keyboard.
+
+        Args:
+            context (CallbackContext): The context from the update.
+            update (Update): The update object containing the incoming update.
+            company (ModelPlaceCard): instance of model.ModelPlaceCard object from database.
+        """
+        text = f"{self._format_place_card(company)}\nChoose a field to edit:"
+
+        # The card goes first, the Save/Exit prompt below it
+        if update.callback_query:
+            await update.callback_query.edit_message_text(
+                text=text, reply_markup=_EDIT_BAR_MARKUP
+            )
+        else:
+            await self._say(update, context, text, reply_markup=_EDIT_BAR_MARKUP)
         await self.show_edit_keyboard(update=update, context=context)
 
+    @staticmethod
+    def _format_place_card(company: ModelPlaceCard) -> str:
+        """
+        Formats the details of a place card as message text.
+
+        Args:
+            company (ModelPlaceCard): instance of model.ModelPlaceCard object from database.
+        """
+        return (
+            f"Name: {company.Name}\n"
+            f"Type: {company.type}\n"
+            f"Photos: {company.photo}\n"
+            f"Google map: {company.google_map}\n"
+            f"Phone numbers: {company.phone_number}\n"
+            f"WhatsApp: {company.whatsapp}\n"
+            f"Manager Phone Number: {company.manager_phone_number}\n"
+            f"Hours of operation: {company.hours_of_operation}\n"
+        )
+
     async def show_place_card(
         self,
         update: Update,
@@ -362,30 +760,15 @@ class TelegramBot:
         logger.info("Displaying place card details")
 
         # Format the information message with all details
-        info_message = (
-            f"Name: {company.Name}\n"
-            f"Type: {company.type}\n"
-            f"Photos: {company.photo}\n"
-            f"Google map: {company.google_map}\n"
-            f"Phone numbers: {company.phone_number}\n"
-            f"WhatsApp: {company.whatsapp}\n"
-            f"Manager Phone Number: {company.manager_phone_number}\n"
-            f"Hours of operation: {company.hours_of_operation}\n"
-        )
+        info_message = self._format_place_card(company)
 
         if edit_state:
-            keyboard = [[InlineKeyboardButton("Edit", callback_data="edit_place_card")]]
-            reply_markup = InlineKeyboardMarkup(keyboard)
-            await context.bot.send_message(
-                chat_id=update.effective_chat.id,
-                text=info_message,
-                reply_markup=reply_markup,
+            await self._say(
+                update, context, info_message, reply_markup=_EDIT_PLACE_MARKUP
             )
             return
 
-        await context.bot.send_message(
-            chat_id=update.effective_chat.id, text=info_message
-        )
+        await self._say(update, context, info_message)
 
     async def show_editbar(self, update: Update, context: CallbackContext) -> None:
         """
@@ -396,29 +779,8 @@ class TelegramBot:
             context (CallbackContext): The context from the update.
         """
         logger.info("Displaying edit bar")
-        keyboard_layout = [
-            [InlineKeyboardButton("Name", callback_data="Name")],
-            [InlineKeyboardButton("Type", callback_data="type")],
-            [InlineKeyboardButton("Photos", callback_data="photo")],
-            [InlineKeyboardButton("Google map", callback_data="google_map")],
-            [InlineKeyboardButton("Phone numbers", callback_data="phone_number")],
-            [InlineKeyboardButton("WhatsApp Number", callback_data="whatsapp")],
-            [
-                InlineKeyboardButton(
-                    "Manager Phone Number", callback_data="manager_phone_number"
-                )
-            ],
-            [
-                InlineKeyboardButton(
-                    "Hours of operation", callback_data="hours_of_operation"
-                )
-            ],
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard_layout)
-        await context.bot.send_message(
-            chat_id=update.effective_chat.id,
-            text="Choose a field to edit:",
-            reply_markup=reply_markup,
+        await self._say(
+            update, context, "Choose a field to edit:", reply_markup=_EDIT_BAR_MARKUP
         )
 
     async def show_edit_keyboard(
@@ -432,22 +794,18 @@ class TelegramBot:
             context (CallbackContext): The context from the update.
         """
         logger.info("Displaying edit keyboard")
-        keyboard = [["Exit", "Save"]]
-
-        reply_markup = ReplyKeyboardMarkup(
-            keyboard, resize_keyboard=True, one_time_keyboard=True
-        )
 
         if update.message:
             await update.message.reply_text(
                 "Save when you are finished, or exit to cancel changes",
-                reply_markup=reply_markup,
+                reply_markup=_SAVE_EXIT_MARKUP,
             )
         else:
-            await context.bot.send_message(
-                chat_id=update.effective_chat.id,
-                text="Save when you are finished, or exit to cancel changes",
-                reply_markup=reply_markup,
+            await self._say(
+                update,
+                context,
+                "Save when you are finished, or exit to cancel changes",
+                reply_markup=_SAVE_EXIT_MARKUP,
             )
 
     async def handle_exit(self, update: Update, context: CallbackContext):
@@ -473,20 +831,83 @@ class TelegramBot:
 
         try:
             drive = GoogleDrive()
-            folder_link = drive.upload_photo(
-                folder_name=current_card.Name,
-                links=context.user_data["photos_received"],
+            folder_id = await asyncio.to_thread(
+                drive.get_or_create_folder, current_card.Name
+            )
+            semaphore = asyncio.Semaphore(_DRIVE_UPLOADS)
+
+            async def upload(index: int, link: str) -> None:
+                async with semaphore:
+                    await asyncio.to_thread(
+                        drive.upload_one, folder_id, current_card.Name, link, index
+                    )
+
+            # Photos are uploaded concurrently, bounded by the semaphore
+            await asyncio.gather(
+                *(
+                    upload(index, link)
+                    for index, link in enumerate(context.user_data["photos_received"])
+                )
             )
-            current_card.photo = f"{folder_link}"
+            await asyncio.to_thread(drive.make_public_folder, folder_id=folder_id)
+            current_card.photo = drive.folder_link(folder_id)
             context.user_data.pop("photos_received")
-            logger.info(f"Photos from {user} successfully uploaded")
+            logger.info("Photos from %s successfully uploaded", user)
         except Exception as ex:
-            logging.error(f"Error while GoogleDrive uploading: {ex}")
+            logger.error("Error while GoogleDrive uploading: %s", ex)
             current_card.photo = "None"
-            await context.bot.send_message(
-                chat_id=update.effective_chat.id,
-                text="Error while uploading photos, try again",
+            await self._say(update, context, "Error while uploading photos, try again")
+
+    def _save_place_card(self, place_card_data: ModelPlaceCard) -> dict | None:
+        """
+        Writes the place card to the database.
+        Blocking, runs in a worker thread.
+
+        Args:
+            place_card_data (ModelPlaceCard): The place card to save.
+
+        Returns:
+            dict | None: Column values of the card before saving, None for a new card.
+        """
+        old_place_card_dict = None
+        with get_db() as session:
+            # One lookup serves both as the old snapshot and the existence check
+            old_place_card = (
+                session.query(ModelPlaceCard).filter_by(ID=place_card_data.ID).first()
             )
+            if old_place_card:
+                old_place_card_dict = dict(
+                    zip(_CARD_COLS, _card_getter(old_place_card))
+                )
+
+                # Single UPDATE statement for every row with this ID
+                session.query(ModelPlaceCard).filter_by(ID=place_card_data.ID).update(
+                    {
+                        ModelPlaceCard.Name: place_card_data.Name,
+                        ModelPlaceCard.type: place_card_data.type,
+                        ModelPlaceCard.photo: place_card_data.photo,
+                        ModelPlaceCard.location: place_card_data.location,
+                        ModelPlaceCard.google_map: place_card_data.google_map,
+                        ModelPlaceCard.phone_number: place_card_data.phone_number,
+                        ModelPlaceCard.whatsapp: place_card_data.whatsapp,
+                        ModelPlaceCard.manager_phone_number: (
+                            place_card_data.manager_phone_number
+                        ),
+                        ModelPlaceCard.hours_of_operation: (
+                            place_card_data.hours_of_operation
+                        ),
+                        ModelPlaceCard.is_updated: True,
+                    },
+                    synchronize_session=False,
+                )
+            else:
+                session.add(place_card_data)
+
+            session.commit()
+
+        invalidate_place(place_card_data.ID)
+
+        return old_place_card_dict
 
     async def handle_save(self, update: Update, context: CallbackContext) -> None:
         """
@@ -505,8 +926,7 @@ class TelegramBot:
         Raises:
             Exception: Logs any exceptions that occur during notification sending or other asynchronous operations.
         """
-        logger.info("Saving place card")
-        logger.info(f"user ID {update.message.from_user.id}")
+        logger.info("Saving place card, user ID %s", update.message.from_user.id)
 
         place_card_data = context.user_data.get("current_card")
 
@@ -519,53 +939,21 @@ class TelegramBot:
             await update.message.reply_text("There was an error processing your data.")
             return
 
+        # A repeated Save in the same chat waits for this one, see PerChatUpdateProcessor
         drive_upload_flag = context.user_data.get("photos_received")
         if drive_upload_flag:
             await self.drive_upload(update=update, context=context)
 
-        old_place_card = None
-        with get_db() as session:
-            old_place_card = (
-                session.query(ModelPlaceCard).filter_by(ID=place_card_data.ID).first()
-            )
-            if old_place_card:
-                old_place_card_dict = old_place_card.__dict__.copy()
-                old_place_card_dict.pop(
-                    "_sa_instance_state", None
-                )  # Removing SQLAlchemy Service Attribute
-
-            existing_place_cards = (
-                session.query(ModelPlaceCard).filter_by(ID=place_card_data.ID).all()
-            )
-
-            if existing_place_cards:
-                for place_card in existing_place_cards:
-                    place_card.Name = place_card_data.Name
-                    place_card.type = place_card_data.type
-                    place_card.photo = place_card_data.photo
-                    place_card.location = place_card_data.location
-                    place_card.google_map = place_card_data.google_map
-                    place_card.phone_number = place_card_data.phone_number
-                    place_card.whatsapp = place_card_data.whatsapp
-                    place_card.manager_phone_number = (
-                        place_card_data.manager_phone_number
-                    )
-                    place_card.hours_of_operation = place_card_data.hours_of_operation
-                    place_card.is_updated = True
-            else:
-                session.add(place_card_data)
-
-            session.commit()
+        # Snapshot of the values being saved
+        new_place_card = dict(zip(_CARD_COLS, _card_getter(place_card_data)))
+        old_place_card_dict = await asyncio.to_thread(
+            self._save_place_card, place_card_data
+        )
 
         await update.message.reply_text("You saved the place card")
 
         # Sending a change notification
-        new_place_card = place_card_data.__dict__.copy()
-        new_place_card.pop(
-            "_sa_instance_state", None
-        )  # Removing SQLAlchemy Service Attribute
-        notification_sender = NotificationSender(token=self.token)
-        await notification_sender.send_notification(
+        await self._notification_sender.send_notification(
             payload=new_place_card,
             old_payload=old_place_card_dict,
             manager_id=update.message.from_user,
@@ -598,80 +986,19 @@ class TelegramBot:
             # Try to update the value in the current card
             try:
                 current_card = context.user_data["current_card"]
-
-                # Check if the field to update exists in the current card
-                if hasattr(current_card, context.user_data["field_to_update"]):
-                    field_to_update = context.user_data["field_to_update"]
-
-                    # Perform validation based on the field to update
-                    if field_to_update == "Name" and not self.validate_name(new_value):
-                        await context.bot.send_message(
-                            chat_id=update.effective_chat.id,
-                            text="Invalid name. Please enter a valid name with only letters, spaces, and apostrophes.",
+                field_to_update = context.user_data["field_to_update"]
+                parse_value = self._field_handlers.get(field_to_update)
+
+                # Check if the field to update can be edited
+                if parse_value:
+                    # Validate and normalize the value for this field
+                    new_value, error = parse_value(new_value, update)
+                    if error:
+                        text, reply_markup = error
+                        await self._say(
+                            update, context, text, reply_markup=reply_markup
                         )
                         return
-                    elif field_to_update == "type":
-                        if new_value not in ["Places to eat", "Adventures", "Services"]:
-                            keyboard_layout = [
-                                [
-                                    InlineKeyboardButton(
-                                        "Places to eat", callback_data="Places to eat"
-                                    )
-                                ],
-                                [
-                                    InlineKeyboardButton(
-                                        "Adventures", callback_data="Adventures"
-                                    )
-                                ],
-                                [
-                                    InlineKeyboardButton(
-                                        "Services", callback_data="Services"
-                                    )
-                                ],
-                            ]
-                            reply_markup = InlineKeyboardMarkup(keyboard_layout)
-                            await context.bot.send_message(
-                                chat_id=update.effective_chat.id,
-                                text="Invalid type. Please choose one of the following types:",
-                                reply_markup=reply_markup,
-                            )
-                            return
-                    elif field_to_update == "photo":
-                        # Photos are handled separately in another method
-                        if not update.message.photo or not self.validate_photos(
-                            update.message.photo
-                        ):
-                            await context.bot.send_message(
-                                chat_id=update.effective_chat.id,
-                                text="Invalid photos. Please send valid photo files.",
-                            )
-                            return
-                        new_value = (
-                            update.message.photo
-                        )  # Update with the actual photo list
-                    elif (
-                        field_to_update == "google_map"
-                        and not self.validate_google_maps(new_value)
-                    ):
-                        await context.bot.send_message(
-                            chat_id=update.effective_chat.id,
-                            text="Invalid input for google_map. Provide a link to Google Maps using the following format https://maps.app.goo.gl/{LocationID}.",
-                        )
-                        return
-                    elif field_to_update in [
-                        "phone_number",
-                        "whatsapp",
-                        "manager_phone_number",
-                    ]:
-                        # Validate and process phone number
-                        digits_only = "".join(filter(str.isdigit, new_value))
-                        if len(digits_only) == 8:
-                            processed_number = "+506" + digits_only
-                        elif len(digits_only) == 11 and digits_only.startswith("506"):
-                            processed_number = "+" + digits_only
-                        else:
-                            processed_number = digits_only
-                        new_value = processed_number
 
                     # Update the value in the current card
                     setattr(current_card, field_to_update, new_value)
@@ -689,20 +1016,15 @@ class TelegramBot:
                     )
                     await self.show_editbar(update=update, context=context)
                 else:
-                    logger.warning(
-                        f"Invalid field: {context.user_data['field_to_update']}"
-                    )
+                    logger.warning("Invalid field: %s", field_to_update)
                     # Inform the user if the field is invalid
-                    await context.bot.send_message(
-                        chat_id=update.effective_chat.id,
-                        text=f"Invalid field: {context.user_data['field_to_update']}",
+                    await self._say(
+                        update, context, f"Invalid field: {field_to_update}"
                     )
             except Exception as e:
                 # Handle any exceptions that occur during the update process
-                logger.error(f"Error updating field: {str(e)}")
-                await context.bot.send_message(
-                    chat_id=update.effective_chat.id, text=f"Error: {str(e)}"
-                )
+                logger.error("Error updating field: %s", e)
+                await self._say(update, context, f"Error: {str(e)}")
 
     async def button(self, update: Update, context: CallbackContext) -> NoReturn:
         """
@@ -720,51 +1042,32 @@ class TelegramBot:
             context.user_data["current_card"] = current_card
 
         # Check if the data corresponds to one of the field options
-        if data in ["Places to eat", "Adventures", "Services"]:
+        if data in _VALID_TYPES:
             # Save the selected type to the current card
             current_card.type = data
             context.user_data.pop("field_to_update", None)
 
             try:
-                await context.bot.send_message(
-                    chat_id=update.effective_chat.id, text=f"Type updated to {data}"
-                )
+                await self._say(update, context, f"Type updated to {data}")
 
                 await self.show_place_card(
                     update=update, context=context, company=current_card
                 )
                 await self.show_editbar(update=update, context=context)
             except DetachedInstanceError as e:
-                logger.error(f"Error updating type: {str(e)}")
-                await context.bot.send_message(
-                    chat_id=update.effective_chat.id, text=f"Error: {str(e)}"
-                )
+                logger.error("Error updating type: %s", e)
+                await self._say(update, context, f"Error: {str(e)}")
         else:
             # Handle selection of a field to update
             context.user_data["field_to_update"] = data
             if data == "type":
                 # Display type options for selection
-                keyboard_layout = [
-                    [
-                        InlineKeyboardButton(
-                            "Places to eat", callback_data="Places to eat"
-                        )
-                    ],
-                    [InlineKeyboardButton("Adventures", callback_data="Adventures")],
-                    [InlineKeyboardButton("Services", callback_data="Services")],
-                ]
-                reply_markup = InlineKeyboardMarkup(keyboard_layout)
-                await context.bot.send_message(
-                    chat_id=update.effective_chat.id,
-                    text="Choose a type:",
-                    reply_markup=reply_markup,
+                await self._say(
+                    update, context, "Choose a type:", reply_markup=_TYPE_MARKUP
                 )
             else:
                 await update.callback_query.answer()
-                await context.bot.send_message(
-                    chat_id=update.effective_chat.id,
-                    text=f"Enter new value for {data}",
-                )
+                await self._say(update, context, f"Enter new value for {data}")
 
     async def add_photo(self, update: Update, context: CallbackContext) -> int:
         """
@@ -775,10 +1078,7 @@ class TelegramBot:
             context (CallbackContext): The context from the update.
         """
 
-        await context.bot.send_message(
-            chat_id=update.effective_chat.id,
-            text="Send photos below and then do /finish",
-        )
+        await self._say(update, context, "Send photos below and then do /finish")
         return 1
 
     async def photo_handler(self, update: Update, context: CallbackContext) -> int:
@@ -792,17 +1092,13 @@ class TelegramBot:
 
         user = update.message.from_user.first_name
 
-        photo_file = await update.message.photo[-1].get_file()
-        if photo_file.file_size <= 25000000:
-            context.user_data.setdefault("photos_received", []).append(
-                photo_file.file_path
-            )
-            logger.info(f"{user} added photo {photo_file.file_id}")
+        # Only the file_id is kept here, download links are resolved in finish_photo
+        photo = update.message.photo[-1]
+        if (photo.file_size or 0) <= 25000000:
+            context.user_data.setdefault("photo_ids", []).append(photo.file_id)
+            logger.info("%s added photo %s", user, photo.file_id)
         else:
-            await context.bot.send_message(
-                chat_id=update.effective_chat.id,
-                text="Photo size should be < 25 megabytes",
-            )
+            await self._say(update, context, "Photo size should be < 25 megabytes")
 
         return 1
 
@@ -817,6 +1113,14 @@ class TelegramBot:
             update (Update): The update object containing the incoming update.
             context (CallbackContext): The context from the update.
         """
+        photo_ids = context.user_data.pop("photo_ids", [])
+        photo_files = await asyncio.gather(
+            *(context.bot.get_file(file_id) for file_id in photo_ids)
+        )
+        context.user_data.setdefault("photos_received", []).extend(
+            photo_file.file_path for photo_file in photo_files
+        )
+
         amount_photo = len(context.user_data["photos_received"])
         current_card = context.user_data["current_card"]
         place_card_text = (
@@ -844,21 +1148,16 @@ class TelegramBot:
         latitude = user_location.latitude
         longitude = user_location.longitude
 
-        logger.info(f"Received location: latitude={latitude}, longitude={longitude}")
+        logger.info("Received location: latitude=%s, longitude=%s", latitude, longitude)
 
-        context.user_data.setdefault("location", [longitude, latitude])
-        context.user_data.setdefault("page", 0)
-
-        keyboard = [
-            InlineKeyboardButton(text="With photos", callback_data="photo_true"),
-            InlineKeyboardButton(text="Without photos", callback_data="photo_false"),
-        ]
-        reply_markup = InlineKeyboardMarkup([keyboard])
+        context.user_data["location"] = [longitude, latitude]
+        context.user_data["page"] = 0
 
-        await context.bot.send_message(
-            chat_id=update.effective_chat.id,
-            text="Choose places with(out) photo:",
-            reply_markup=reply_markup,
+        await self._say(
+            update,
+            context,
+            "Choose places with(out) photo:",
+            reply_markup=_PHOTO_FILTER_MARKUP,
         )
         return 1
 
@@ -875,19 +1174,16 @@ class TelegramBot:
         await query.answer()
 
         if query.data == "photo_true":
-            context.user_data.setdefault("photo_status", "True")
+            context.user_data["photo_status"] = "True"
         elif query.data == "photo_false":
-            context.user_data.setdefault("photo_status", "False")
+            context.user_data["photo_status"] = "False"
             text = "out"
 
         text = (
             f"Send me radius(example: 0.5). Returns places around in 500m with{text} photos."
             f"If something went wrong send command /cancel_location"
         )
-        await context.bot.send_message(
-            chat_id=update.effective_chat.id,
-            text=text,
-        )
+        await self._say(update, context, text)
         return 2
 
     async def send_venue_list(
@@ -902,68 +1198,32 @@ class TelegramBot:
             radius (float): User radius value.
         """
 
-        LEN_LIST = 3
-        page = int(context.user_data["page"])
-        start_id = page * LEN_LIST
-        end_id = start_id + LEN_LIST
-        max_page = 0
-
+        page = context.user_data["page"]
         places_list = context.user_data["places_list"]
 
-        if places_list:
-            if len(places_list) >= LEN_LIST:
-                max_page = (len(places_list) / LEN_LIST) - 1
-            elif max_page > 0:
-                if max_page % int(max_page) > 0:
-                    max_page = int(max_page) + 1
-        else:
-            await context.bot.send_message(
-                chat_id=update.effective_chat.id,
-                text="No places around in selected radius, use /cancel_location",
+        if not places_list:
+            await self._say(
+                update,
+                context,
+                "No places around in selected radius, use /cancel_location",
             )
             return
 
-        context.user_data.setdefault("max_page", max_page)
+        max_page = context.user_data["max_page"]
+        start_id = page * _LEN_LIST
 
-        keyboard = []
-        if page < max_page:
-            for item in places_list[start_id:end_id]:
-                keyboard.append(
-                    [
-                        InlineKeyboardButton(
-                            item["message"], callback_data=f'notion_{item["id"]}'
-                        )
-                    ]
-                )
-        elif page == max_page:
-            end_id = len(places_list)
-            for item in places_list[start_id:end_id]:
-                keyboard.append(
-                    [
-                        InlineKeyboardButton(
-                            item["message"], callback_data=f'notion_{item["id"]}'
-                        )
-                    ]
+        keyboard = [
+            [
+                InlineKeyboardButton(
+                    item["message"], callback_data=f'{_PLACE_PREFIX}{item["id"]}'
                 )
-
-        buttons = [
-            InlineKeyboardButton(text="<", callback_data="page_prev"),
-            InlineKeyboardButton(text=">", callback_data="page_next"),
+            ]
+            for item in itertools.islice(places_list, start_id, start_id + _LEN_LIST)
         ]
-
-        if len(places_list) <= LEN_LIST:
-            keyboard.append(
-                [InlineKeyboardButton(text="Exit", callback_data="exit_location")]
-            )
-            reply_markup = InlineKeyboardMarkup(keyboard)
-        elif len(places_list) > LEN_LIST and page <= max_page:
-            keyboard.append(buttons)
-            keyboard.append(
-                [InlineKeyboardButton(text="Exit", callback_data="exit_location")]
-            )
-            reply_markup = InlineKeyboardMarkup(keyboard)
-        else:
-            reply_markup = None
+        if max_page > 0:
+            keyboard.append(_PAGE_NAV_ROW)
+        keyboard.append(_EXIT_LOCATION_ROW)
+        reply_markup = InlineKeyboardMarkup(keyboard)
 
         if radius <= 1:
             radius = round(radius, 3)
@@ -978,7 +1238,7 @@ class TelegramBot:
                     f"Places in radius {distance}:", reply_markup=reply_markup
                 )
             except telegram.error.BadRequest as ex:
-                logging.debug(f"{ex}")
+                logger.debug("%s", ex)
         else:
             await update.message.reply_text(
                 text=f"Places in radius {distance}:", reply_markup=reply_markup
@@ -1000,18 +1260,22 @@ class TelegramBot:
             return ConversationHandler.END
 
         user_radius = float(update.message.text)
-        context.user_data.setdefault("radius", user_radius)
+        context.user_data["radius"] = user_radius
         longitude, latitude = context.user_data.get("location")
 
-        maps = GoogleMap()
-        places_list = maps.radius_list(
+        # Coordinates lookups and the DB scan block, keep them off the event loop
+        places_list = await asyncio.to_thread(
+            self._maps.radius_list,
             longitude=longitude,
             latitude=latitude,
             radius=context.user_data["radius"],
             photo=context.user_data["photo_status"],
         )
 
-        context.user_data.setdefault("places_list", places_list)
+        # radius_list returns None when nothing is in range
+        places_list = places_list or []
+        context.user_data["places_list"] = places_list
+        context.user_data["max_page"] = max(0, (len(places_list) - 1) // _LEN_LIST)
 
         await self.send_venue_list(update=update, context=context, radius=user_radius)
         return 3
@@ -1046,10 +1310,10 @@ class TelegramBot:
                 update, context, radius=context.user_data["radius"]
             )
 
-        elif query.data.startswith("notion_"):
-            notion_id = query.data.split("_")[1]
+        elif query.data.startswith(_PLACE_PREFIX):
+            notion_id = query.data.removeprefix(_PLACE_PREFIX)
 
-            company = get_place_by_id(int(notion_id))
+            company = await asyncio.to_thread(get_place_by_id, int(notion_id))
             context.user_data["current_card"] = company
 
             await self.show_place_card(
@@ -1079,9 +1343,8 @@ class TelegramBot:
         await query.answer()
         context.user_data.clear()
 
-        await context.bot.send_message(
-            chat_id=update.effective_chat.id,
-            text="Showing radius list has been stopped, now send /start",
+        await self._say(
+            update, context, "Showing radius list has been stopped, now send /start"
         )
         return ConversationHandler.END
 
@@ -1098,9 +1361,8 @@ class TelegramBot:
 
         context.user_data.clear()
 
-        await context.bot.send_message(
-            chat_id=update.effective_chat.id,
-            text="Showing radius list has been stopped, now send /start",
+        await self._say(
+            update, context, "Showing radius list has been stopped, now send /start"
         )
         return ConversationHandler.END
 
@@ -1120,7 +1382,7 @@ class TelegramBot:
 
         button_instance = CallbackQueryHandler(
             self.button,
-            pattern="^(Name|type|google_map|phone_number|whatsapp|manager_phone_number|hours_of_operation|Places to eat|Adventures|Services)$",
+            pattern=_BUTTON_DATA.__contains__,
         )
 
         exit_handler = MessageHandler(filters.Regex("^Exit$"), self.handle_exit)
@@ -1153,7 +1415,7 @@ class TelegramBot:
                 3: [
                     CallbackQueryHandler(
                         self.prev_next_button,
-                        pattern="^notion_\d+$|page_next|page_prev",
+                        pattern=_is_page_button,
                     ),
                     CallbackQueryHandler(self.exit_location, pattern="^exit_location$"),
                 ],
@@ -1191,4 +1453,4 @@ class TelegramBot:
         try:
             self.application.run_polling()
         except RuntimeError as e:
-            logger.error(f"Failed to stop the event loop gracefully: {e}")
+            logger.error("Failed to stop the event loop gracefully: %s", e)
@@ -1,4 +1,4 @@
-from sqlalchemy import create_engine, inspect
+from sqlalchemy import create_engine, inspect, make_url
 from sqlalchemy.orm import sessionmaker, declarative_base, Session
 import logging
 from config import mysql_db_path
@@ -10,21 +10,40 @@ from config import NOTION_API_ID, NOTION_DATABASE_ID
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Connection pool settings
+POOL_SIZE = 20
+MAX_OVERFLOW = 40
+POOL_RECYCLE = 1800  # seconds, below MySQL wait_timeout
+
+# Queue pool sizing applies to server databases, sqlite picks its own pool class
+_pool_options = (
+    {}
+    if make_url(mysql_db_path).get_backend_name() == "sqlite"
+    else {"pool_size": POOL_SIZE, "max_overflow": MAX_OVERFLOW}
+)
+
 # Create engine DB
-engine = create_engine(mysql_db_path)
+engine = create_engine(
+    mysql_db_path,
+    pool_pre_ping=True,
+    pool_recycle=POOL_RECYCLE,
+    **_pool_options,
+)
 
 # Create metadata
 Base = declarative_base()
 
-LocalSession = sessionmaker(autoflush=True, autocommit=False, bind=engine)
+# Instances stay readable after commit, handlers keep them detached in user_data
+LocalSession = sessionmaker(
+    autoflush=True, autocommit=False, expire_on_commit=False, bind=engine
+)
 
 
 def get_db() -> Session:
-    """Return a database session"""
+    """Return a database session, the caller is responsible for closing it"""
 
-    with LocalSession() as session:
-        logger.info("Got session")
-        return session
+    logger.info("Got session")
+    return LocalSession()
 
 
 def init_db() -> None:
@@ -43,3 +62,16 @@ def init_db() -> None:
             update_database_from_notion(NOTION_API_ID, NOTION_DATABASE_ID)
     else:
         logger.info("Database already initialized.")
+        _create_missing_indexes(inspector)
+
+
+def _create_missing_indexes(inspector) -> None:
+    """Creates indexes declared on the models but absent from an existing database"""
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name not in existing:
+                index.create(engine)
+                logger.info("Created index %s", index.name)
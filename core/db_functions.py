@@ -1,12 +1,15 @@
 import logging
-from typing import Optional, Type, NoReturn
+import threading
+from typing import Optional, NoReturn
 import pandas as pd
-from sqlalchemy import create_engine
 import os
-from models.notion import Notion
+from cachetools import TTLCache
+from models.notion import OLDEST_FIRST, Notion
+from core.db import LocalSession
 from core.model import ModelPlaceCard
+from sqlalchemy import Row, insert, select
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import make_transient_to_detached
 from config import mysql_db_path
 from logging.handlers import RotatingFileHandler
 
@@ -24,46 +27,18 @@ logging.basicConfig(
 )
 
 
-class FlushFileHandler(logging.FileHandler):
-    """
-    Custom FileHandler that flushes after every log message.
-    """
-
-    def emit(self, record) -> None:
-        super().emit(record)
-        self.flush()
-
-
 # delete standard FileHandler
-for handler in logging.getLogger().handlers:
+for handler in logging.getLogger().handlers[:]:
     if isinstance(handler, logging.FileHandler):
         logging.getLogger().removeHandler(handler)
 
-# add custom FileHandler
-logging.getLogger().addHandler(
-    FlushFileHandler(log_file_path, mode="w", encoding="utf-8")
-)
-
 # Size settings
 max_log_file_size = 1 * 1024 * 1024  # 1 MB
 backup_count = 5  # Number of backup copies"
-rotating_handler = RotatingFileHandler(
-    log_file_path,
-    mode="w",
-    encoding="utf-8",
-    maxBytes=max_log_file_size,
-    backupCount=backup_count,
-)
-
-
-# Set FlushFileHandler, worк as  RotatingFileHandler
-class FlushRotatingFileHandler(FlushFileHandler, RotatingFileHandler):
-    pass
 
-
-# add users RotatingFileHandler
+# add a single rotating log file handler
 logging.getLogger().addHandler(
-    FlushRotatingFileHandler(
+    RotatingFileHandler(
         log_file_path,
         mode="w",
         encoding="utf-8",
@@ -73,32 +48,84 @@ logging.getLogger().addHandler(
 )
 
 
-def search_by_key(dictionary: dict, key: str) -> str:
+# Column values of recently read place cards by ID, shared between handler threads
+_place_cache = TTLCache(maxsize=1024, ttl=300)
+_place_cache_lock = threading.Lock()
+_PLACE_COLUMNS = tuple(attr.key for attr in ModelPlaceCard.__mapper__.column_attrs)
+
+
+def invalidate_place(id: int | str | None = None) -> None:
     """
-    Searches for all values associated with the specified key in a nested dictionary or list.
+    Drop a place card from the lookup cache, or the whole cache if no ID is given.
 
     Args:
-    dictionary (dict): The nested dictionary or list in which to perform the search.
-    key (str): The key whose values need to be found.
+    id (int | str | None): The ID of the changed company.
+    """
+    with _place_cache_lock:
+        if id is None:
+            _place_cache.clear()
+        else:
+            _place_cache.pop(str(id), None)
 
-    Returns:
-    str: A string containing all the found values, separated by commas.
+
+def _first_plain_text(value: dict, kind: str) -> Optional[str]:
     """
-    results = []
+    Return the plain text of the first fragment of a title or rich_text property.
+    """
+    fragments = value.get(kind)
+    return fragments[0].get("plain_text") if fragments else None
+
 
-    def recursive_search(d, target_key):
-        if isinstance(d, dict):
-            for k, v in d.items():
-                if k == target_key:
-                    results.append(v)
-                if isinstance(v, (dict, list)):
-                    recursive_search(v, target_key)
-        elif isinstance(d, list):
-            for item in d:
-                recursive_search(item, target_key)
+def _select_name(value: dict) -> Optional[str]:
+    """
+    Return the option name of a select property.
+    """
+    return (value.get("select") or {}).get("name")
+
+
+# Notion property name -> (ModelPlaceCard attribute, value extractor)
+NOTION_FIELDS = {
+    "Name": ("Name", lambda value: _first_plain_text(value, "title")),
+    "Type": ("type", _select_name),
+    "ID": ("ID", lambda value: value.get("number")),
+    "Photo Google Drive": ("photo", lambda value: value.get("url")),
+    "Google Map": ("google_map", lambda value: value.get("url")),
+    "Phone Number": (
+        "phone_number",
+        lambda value: _first_plain_text(value, "rich_text"),
+    ),
+    "WhatsApp Number": (
+        "whatsapp",
+        lambda value: _first_plain_text(value, "rich_text"),
+    ),
+    "Hours of Operation": (
+        "hours_of_operation",
+        lambda value: _first_plain_text(value, "rich_text"),
+    ),
+    "Owner / Manager": (
+        "manager_phone_number",
+        lambda value: _first_plain_text(value, "rich_text"),
+    ),
+    "Location": ("location", _select_name),
+}
+_NOTION_ATTRIBUTES = tuple(attribute for attribute, _ in NOTION_FIELDS.values())
+
+
+def _notion_row_to_dict(row: dict) -> dict:
+    """
+    Convert a Notion page into ModelPlaceCard column values.
 
-    recursive_search(dictionary, key)
-    return results[0] if results else None
+    Every row gets the same keys, missing properties default to an empty string,
+    so a page of rows goes out as one executemany batch.
+    """
+    place_card = dict.fromkeys(_NOTION_ATTRIBUTES, "")
+    place_card["id_page"] = row.get("id", "")
+    for key, value in row.get("properties", {}).items():
+        field = NOTION_FIELDS.get(key)
+        if field is not None:
+            attribute, extract = field
+            place_card[attribute] = extract(value)
+    return place_card
 
 
 def update_database_from_notion(API_ID: str, DATABASE_ID: str) -> None:
@@ -109,61 +136,16 @@ def update_database_from_notion(API_ID: str, DATABASE_ID: str) -> None:
     # db_path = "core/database.db"
     logging.info(f"Database path: {mysql_db_path}")
 
-    # connect to database
-    engine = create_engine(mysql_db_path)
-    logging.info(f"Connecting to database at: {mysql_db_path}")
-
-    Session = sessionmaker(bind=engine)
-    session = Session()
     Notion_session = Notion(API_ID, DATABASE_ID)
-    rows = Notion_session.read_all_rows()
-    for num in reversed(rows):
-        model_place_card = ModelPlaceCard()
-        for keys, values in num.items():
-            logging.info(f"Connecting to database at: {keys}:{values}")
-
-            if keys == "id":
-                model_place_card.id_page = values
-            if keys == "properties":
-                for key, value in values.items():
-
-                    if key == "Name":
-                        model_place_card.Name = search_by_key(value, "plain_text")
-
-                    if key == "Type":
-                        model_place_card.type = search_by_key(value, "name")
-
-                    if key == "ID":
-                        model_place_card.ID = search_by_key(value, "number")
-
-                    if key == "Photo Google Drive":
-                        model_place_card.photo = search_by_key(value, "url")
-
-                    if key == "Google Map":
-                        model_place_card.google_map = search_by_key(value, "url")
-
-                    if key == "Phone Number":
-                        model_place_card.phone_number = search_by_key(
-                            value, "plain_text"
-                        )
-
-                    if key == "WhatsApp Number":
-                        model_place_card.whatsapp = search_by_key(value, "plain_text")
-
-                    if key == "Hours of Operation":
-                        model_place_card.hours_of_operation = search_by_key(
-                            value, "plain_text"
-                        )
 
-                    if key == "Owner / Manager":
-                        model_place_card.manager_phone_number = search_by_key(
-                            value, "plain_text"
-                        )
-                    if key == "Location":
-                        model_place_card.location = search_by_key(value, "name")
-
-        session.add(model_place_card)
-    session.commit()
+    # Rows are inserted page by page as Notion returns them, oldest first
+    with LocalSession() as session:
+        for page in Notion_session.iter_pages(sorts=OLDEST_FIRST):
+            if page:
+                session.execute(
+                    insert(ModelPlaceCard), [_notion_row_to_dict(row) for row in page]
+                )
+        session.commit()
 
 
 def find_company_by_name(name: str) -> Optional[ModelPlaceCard]:
@@ -176,13 +158,7 @@ def find_company_by_name(name: str) -> Optional[ModelPlaceCard]:
     Returns:
     Optional[ModelPlaceCard]: The found or newly created ModelPlaceCard instance.
     """
-    engine = create_engine(mysql_db_path)
-    logging.info(f"Connecting to database at: {mysql_db_path}")
-
-    Session = sessionmaker(bind=engine)
-    session = Session()
-
-    try:
+    with LocalSession() as session:
         company = session.query(ModelPlaceCard).filter_by(Name=name).first()
         if not company:
             company = ModelPlaceCard(Name=name)
@@ -190,8 +166,6 @@ def find_company_by_name(name: str) -> Optional[ModelPlaceCard]:
             session.commit()
             session.refresh(company)
         return company
-    finally:
-        session.close()
 
 
 def get_place_by_id(id: int) -> Optional[ModelPlaceCard]:
@@ -202,41 +176,46 @@ def get_place_by_id(id: int) -> Optional[ModelPlaceCard]:
     id (int): The ID of the company to find.
 
     Returns:
-    Optional[ModelPlaceCard]: The found ModelPlaceCard instance.
+    Optional[ModelPlaceCard]: A detached copy of the found ModelPlaceCard instance,
+    callers may modify it without affecting the cache.
     """
-    engine = create_engine(mysql_db_path)
-    logging.info(f"Connecting to database at: {mysql_db_path}")
+    with _place_cache_lock:
+        values = _place_cache.get(str(id))
 
-    Session = sessionmaker(bind=engine)
-    session = Session()
+    if values is None:
+        with LocalSession() as session:
+            company = session.query(ModelPlaceCard).filter_by(ID=id).first()
+            if company is None:
+                return None
+            values = {column: getattr(company, column) for column in _PLACE_COLUMNS}
 
-    try:
-        company = session.query(ModelPlaceCard).filter_by(ID=id).first()
-        return company
-    finally:
-        session.close()
+        with _place_cache_lock:
+            _place_cache[str(id)] = values
+
+    company = ModelPlaceCard(**values)
+    make_transient_to_detached(company)
+    return company
 
 
-def get_maps_filtered_rows() -> list[Type[ModelPlaceCard]]:
+def get_maps_filtered_rows() -> list[Row]:
     """
     Returns list with all rows where column Google Map not blanked.
 
+    Only the columns used by the radius search are selected, rows are plain
+    Row tuples with attribute access rather than ORM instances.
+
     Returns:
-    list[Type[ModelPlaceCard]]: list with filtered rows.
+    list[Row]: list with filtered rows (ID, Name, photo, coordinates).
     """
-    engine = create_engine(mysql_db_path)
-    logging.info(f"Connecting to database in get filtered at: {mysql_db_path}")
-
-    Session = sessionmaker(bind=engine)
-    session = Session()
+    stmt = select(
+        ModelPlaceCard.ID,
+        ModelPlaceCard.Name,
+        ModelPlaceCard.photo,
+        ModelPlaceCard.coordinates,
+    ).where(ModelPlaceCard.google_map != "")
 
-    try:
-        filtered = (
-            session.query(ModelPlaceCard).filter(ModelPlaceCard.google_map != "").all()
-        )
-        return filtered
-    finally:
-        session.close()
+    with LocalSession() as session:
+        return session.execute(stmt).all()
 
 
 def put_coordinates(model: ModelPlaceCard, location: tuple[float, float]) -> NoReturn:
@@ -248,17 +227,11 @@ def put_coordinates(model: ModelPlaceCard, location: tuple[float, float]) -> NoR
     location (tuple[float, float]): place coordinates
     """
     location = str(location)
-    engine = create_engine(mysql_db_path)
-    logging.info(f"Connecting to database in put coords at: {mysql_db_path}")
-
-    Session = sessionmaker(bind=engine)
-    session = Session()
-
     model.coordinates = location[1:-2]
 
-    try:
+    with LocalSession() as session:
         session.add(model)
         session.commit()
         logging.info(f"Fetch coordinates in database: {location}")
-    finally:
-        session.close()
+
+    invalidate_place(model.ID)
@@ -1,13 +1,27 @@
-from sqlalchemy import Column, Integer, String, Boolean
+from sqlalchemy import Column, Index, Integer, String, Boolean
 from core.db import Base
 
 
 class ModelPlaceCard(Base):
 
     __tablename__ = "google_sheet_data"
-    Name = Column(String, default="", name="Name")
+    # Lookups by ID and by Name. New tables get VARCHAR(64)/VARCHAR(255) columns, tables
+    # created before that keep TEXT columns, which MySQL only indexes with a prefix length
+    __table_args__ = (
+        Index("ix_google_sheet_data_ID", "ID", mysql_length=64),
+        Index("ix_google_sheet_data_Name", "Name", mysql_length=255),
+        # Sync lookups: pending flags per Notion page, and dirty rows to push to Notion
+        Index(
+            "ix_google_sheet_data_id_page_is_updated",
+            "id_page",
+            "is_updated",
+            mysql_length={"id_page": 36},
+        ),
+        Index("ix_google_sheet_data_is_new_is_updated", "is_new", "is_updated"),
+    )
+    Name = Column(String(255), default="", name="Name")
     id_key = Column(Integer, primary_key=True, autoincrement=True, name="id_key")
-    ID = Column(String, default="", name="ID")
+    ID = Column(String(64), default="", name="ID")
     id_page = Column(String, default="", name="id_page")
     type = Column(String, default="", name="Type")
     # Web = Column(String, default="", name="Web")
@@ -36,6 +50,19 @@ class ModelPlaceCard(Base):
     is_new = Column(Boolean, default=False, name="is_new")
     is_updated = Column(Boolean, default=False, name="is_updated")
 
+    # (attribute, Notion property) pairs exported by to_dict when set
+    _EXPORT_FIELDS = (
+        ("Name", "Name"),
+        ("type", "Type"),
+        ("photo", "Photo Google Drive"),
+        ("google_map", "Google Map"),
+        ("phone_number", "Phone Number"),
+        ("whatsapp", "WhatsApp Number"),
+        ("hours_of_operation", "Hours of Operation"),
+        ("manager_phone_number", "Owner / Manager"),
+        ("location", "Location"),
+    )
+
     def to_dict(self) -> dict:
         """
         Convert the ModelPlaceCard instance to a dictionary.
@@ -43,24 +70,8 @@ class ModelPlaceCard(Base):
         Returns:
         Dict[str, str]: A dictionary representation of the ModelPlaceCard instance with selected attributes.
         """
-        result = {}
-        if self.Name:
-            result["Name"] = self.Name
-        if self.type:
-            result["Type"] = self.type
-        if self.photo:
-            result["Photo Google Drive"] = self.photo
-        if self.google_map:
-            result["Google Map"] = self.google_map
-        if self.phone_number:
-            result["Phone Number"] = self.phone_number
-        if self.whatsapp:
-            result["WhatsApp Number"] = self.whatsapp
-        if self.hours_of_operation:
-            result["Hours of Operation"] = self.hours_of_operation
-        if self.manager_phone_number:
-            result["Owner / Manager"] = self.manager_phone_number
-        if self.manager_phone_number:
-            result["Location"] = self.location
-
-        return result
+        return {
+            label: value
+            for attribute, label in self._EXPORT_FIELDS
+            if (value := getattr(self, attribute))
+        }
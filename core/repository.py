@@ -1,6 +1,6 @@
 from core.db import get_db
 from core.model import ModelPlaceCard
-from sqlalchemy import func, select
+from sqlalchemy import delete, func, select, update
 from models.place_card import PlaceCard
 import logging
 
@@ -36,9 +36,9 @@ class Repository:
         Returns:
             ModelPlaceCard: The data from the DB.
         """
-        correct_card = self.conn.execute(
-            select(ModelPlaceCard).where(ModelPlaceCard.name == name)
-        ).scalar()
+        correct_card = self.conn.scalars(
+            select(ModelPlaceCard).where(ModelPlaceCard.Name == name).limit(1)
+        ).first()
         if correct_card:
             logger.info(f"Reading card id {name}")
             return correct_card
@@ -55,8 +55,7 @@ class Repository:
         """
         self.conn.add(data)
         self.conn.commit()
-        self.conn.refresh(data)
-        logger.info(f"Insert card id {data.name}")
+        logger.info(f"Insert card id {data.Name}")
 
     def delete_card(self, name: str) -> None:
         """
@@ -65,12 +64,11 @@ class Repository:
         Attributes:
             name (str): name of place
         """
-        correct_card = self.conn.execute(
-            select(ModelPlaceCard).where(ModelPlaceCard.name == name)
-        ).scalar()
-        if correct_card:
-            self.conn.delete(correct_card)
-            self.conn.commit()
+        result = self.conn.execute(
+            delete(ModelPlaceCard).where(ModelPlaceCard.Name == name)
+        )
+        self.conn.commit()
+        if result.rowcount:
             logger.info(f"Deleted card id {name}")
         else:
             logger.info(f"Card id {name} not found")
@@ -83,15 +81,13 @@ class Repository:
         Attributes:
             name (str): name of place
         """
-        correct_card = self.read_card(name=name)
-        if correct_card:
-            correct_card.name, correct_card.photo, correct_card.tp = (
-                data.name,
-                data.photos,
-                data.type,
-            )
-            self.conn.commit()
-            self.conn.refresh(correct_card)
+        result = self.conn.execute(
+            update(ModelPlaceCard)
+            .where(ModelPlaceCard.Name == name)
+            .values(Name=data.name, photo=data.photo, type=data.tp)
+        )
+        self.conn.commit()
+        if result.rowcount:
             logger.info(f"Updated card id {name}")
         else:
             logger.info(f"Card id {name} not found")
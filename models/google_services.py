@@ -14,7 +14,6 @@ from googleapiclient.http import MediaIoBaseUpload
 from typing import NoReturn, Any
 from urllib.parse import urlparse, parse_qs
 from haversine import haversine
-from core.db_functions import get_maps_filtered_rows
 
 logging.basicConfig(
     level=logging.INFO,
@@ -22,6 +21,12 @@ logging.basicConfig(
 )
 
 
+# Coordinates in a Google Maps URL path: "@lat,lng,zoom" or a "lat,lng" segment
+_COORDS_RE = re.compile(
+    r"@(-?\d+(?:\.\d+)?),(-?\d+(?:\.\d+)?)|(?:^|/)(-?\d{1,2}\.\d{6}),(-?\d{1,2}\.\d{6})"
+)
+
+
 class GoogleAPI:
     """
     A class responsible for authorization and creation of Google API client.
@@ -387,6 +392,50 @@ class GoogleDrive(GoogleAPI):
                 f"An error occurred in sharing permissions folder process: {err}"
             )
 
+    def get_or_create_folder(self, folder_name: str) -> str | None:
+        """
+        Search folder on Google Drive by name and create it if not found.
+
+        Args:
+            folder_name (str): Name of the folder.
+        """
+        folder_id = self.search_folder(folder_name)
+
+        if not folder_id:
+            folder_id = self.create_folder(folder_name)
+
+        return folder_id
+
+    def upload_one(
+        self, folder_id: str, folder_name: str, photo_link: str, index: int = 0
+    ) -> str | None:
+        """
+        Upload one photo to folder on Google Drive.
+
+        Args:
+            folder_id (str): Google Drive parent folder id.
+            folder_name (str): Name of the folder, used as photo name prefix.
+            photo_link (str): URL path to photo.
+            index (int): Number of photo in the batch, keeps names unique.
+        """
+        date = datetime.datetime.now().strftime("%Y-%m-%d %H-%M-%S")
+        file_name = f"{folder_name}_{date}_{index}"
+        file_id = self.upload_foto_in_spec_folder(
+            folder_id=folder_id, url=photo_link, drive_name_photo=file_name
+        )
+        logging.info(f"{file_name}.png uploaded to {folder_name}")
+        return file_id
+
+    @staticmethod
+    def folder_link(folder_id: str) -> str:
+        """
+        Return public link to folder on Google Drive.
+
+        Args:
+            folder_id (str): Google Drive folder ID.
+        """
+        return f"https://drive.google.com/drive/folders/{folder_id}?usp=drive_link"
+
     def upload_photo(self, folder_name: str, links: list[str]) -> str:
         """
         Upload photos to folder on Google Drive.
@@ -397,23 +446,15 @@ class GoogleDrive(GoogleAPI):
         """
 
         # Create or search folder on Google Drive
-        folder_id = self.search_folder(folder_name)
-
-        if not folder_id:
-            folder_id = self.create_folder(folder_name)
+        folder_id = self.get_or_create_folder(folder_name)
 
         # Create photo name and upload
-        for photo_link in links:
-            date = datetime.datetime.now().strftime("%Y-%m-%d %H-%M-%S")
-            file_name = f"{folder_name}_{date}"
-            self.upload_foto_in_spec_folder(
-                folder_id=folder_id, url=photo_link, drive_name_photo=file_name
-            )
-            logging.info(f"{file_name}.png uploaded to {folder_name}")
+        for index, photo_link in enumerate(links):
+            self.upload_one(folder_id, folder_name, photo_link, index)
 
         self.make_public_folder(folder_id=folder_id)
 
-        return f"https://drive.google.com/drive/folders/{folder_id}?usp=drive_link"
+        return self.folder_link(folder_id)
 
 
 class GoogleMap:
@@ -447,22 +488,12 @@ class GoogleMap:
         Returns:
             tuple[float, float]: A tuple containing the latitude and longitude.
         """
-        coordinates = []
-        regex_pattern = r"(-?\d{1,2}\.\d{6}),(-?\d{1,2}\.\d{6})"
-        parsed_url = urlparse(url)
-
-        # Extract coordinates from the URL
-        path_parts = parsed_url.path.split("/")
-        for part in path_parts:
-            if "@" in part:
-                coordinates = part.split("@")[1].split(",")[:2]
-            elif re.match(regex_pattern, part):
-                coordinates = part.split(",")
-
-            if coordinates:
-                return float(coordinates[0]), float(coordinates[1])
-
-        return None
+        # The first path segment holding "@lat,lng" or a bare "lat,lng" pair
+        match = _COORDS_RE.search(urlparse(url).path)
+        if match is None:
+            return None
+        latitude, longitude = match.group(1, 2) if match.group(1) else match.group(3, 4)
+        return float(latitude), float(longitude)
 
     @staticmethod
     def get_coordinates_from_short_url(short_url: str) -> tuple[float, float]:
@@ -499,6 +530,9 @@ class GoogleMap:
         radius (float): radius value around of user.
         photo (str): collecting parameter for this method, meaning return places with(out) photography.
         """
+        # Imported here: core.db_functions imports models.notion, which imports this module
+        from core.db_functions import get_maps_filtered_rows
+
         radius_list = []
         user_coordinates = (longitude, latitude)
 
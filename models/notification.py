@@ -1,8 +1,9 @@
+import asyncio
 import datetime
 import io
 import logging
 import os
-import re
+import aiohttp
 import gspread
 import pandas as pd
 import requests
@@ -12,14 +13,13 @@ from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from googleapiclient.http import MediaIoBaseUpload
 from typing import NoReturn, Any
-from urllib.parse import urlparse, parse_qs
-from haversine import haversine
-from core.db_functions import get_maps_filtered_rows
+from config import id_notification_list
 
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
 )
+logger = logging.getLogger(__name__)
 
 
 class GoogleAPI:
@@ -416,132 +416,111 @@ class GoogleDrive(GoogleAPI):
         return f"https://drive.google.com/drive/folders/{folder_id}?usp=drive_link"
 
 
-class GoogleMap:
+class NotificationSender:
     """
-    A class to handle Google Maps URL operations, such as expanding shortened URLs
-    and extracting coordinates.
+    A class to notify users from id_notification_list about saved place cards.
+
+    Attributes:
+        token (str): The bot token for authentication with the Telegram API.
+        chat_ids (list): Telegram chat IDs that receive notifications.
+        _session (aiohttp.ClientSession): HTTP session reused between notifications.
+         Default is None, defines in _get_session method.
     """
 
-    @staticmethod
-    def get_full_url(short_url: str) -> str:
-        """
-        Expands a shortened Google Maps URL to its full URL.
+    API_URL = "https://api.telegram.org/bot{token}/sendMessage"
 
-        Args:
-            short_url (str): The shortened URL to expand.
+    FIELDS = {
+        "Name": "Name",
+        "type": "Type",
+        "photo": "Photos",
+        "location": "Location",
+        "google_map": "Google map",
+        "phone_number": "Phone numbers",
+        "whatsapp": "WhatsApp",
+        "manager_phone_number": "Manager Phone Number",
+        "hours_of_operation": "Hours of operation",
+    }
 
-        Returns:
-            str: The expanded URL.
-        """
-        response = requests.head(short_url, allow_redirects=True)
-        return response.url
+    def __init__(self, token: str, chat_ids: list = id_notification_list) -> None:
+        self.token = token
+        self.chat_ids = chat_ids
+        self._url = self.API_URL.format(token=token)
+        self._session = None
 
-    @staticmethod
-    def extract_coordinates_google_maps(url: str) -> tuple[float, float] | None:
+    def _get_session(self) -> aiohttp.ClientSession:
         """
-        Extracts coordinates from a full Google Maps URL.
-
-        Args:
-            url (str): The Google Maps URL.
-
-        Returns:
-            tuple[float, float]: A tuple containing the latitude and longitude.
+        Return the shared aiohttp session, opening it on first use.
         """
-        coordinates = []
-        regex_pattern = r"(-?\d{1,2}\.\d{6}),(-?\d{1,2}\.\d{6})"
-        parsed_url = urlparse(url)
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+        return self._session
 
-        # Extract coordinates from the URL
-        path_parts = parsed_url.path.split("/")
-        for part in path_parts:
-            if "@" in part:
-                coordinates = part.split("@")[1].split(",")[:2]
-            elif re.match(regex_pattern, part):
-                coordinates = part.split(",")
+    def format_message(
+        self, payload: dict, old_payload: dict | None, manager: Any
+    ) -> str:
+        """
+        Forming notification text with the fields that were changed.
 
-            if coordinates:
-                return float(coordinates[0]), float(coordinates[1])
+        Args:
+            payload (dict): New values of the place card.
+            old_payload (dict | None): Values before saving, None for a new card.
+            manager (telegram.User): User who saved the place card.
+        """
+        manager_name = getattr(manager, "full_name", manager)
+
+        if not old_payload:
+            lines = [f"{manager_name} added place card {payload.get('Name')}"]
+            lines += [
+                f"{label}: {payload.get(field)}"
+                for field, label in self.FIELDS.items()
+                if payload.get(field)
+            ]
+            return "\n".join(lines)
 
-        return None
+        lines = [f"{manager_name} updated place card {payload.get('Name')}"]
+        lines += [
+            f"{label}: {old_payload.get(field)} -> {payload.get(field)}"
+            for field, label in self.FIELDS.items()
+            if payload.get(field) != old_payload.get(field)
+        ]
+        return "\n".join(lines)
 
-    @staticmethod
-    def get_coordinates_from_short_url(short_url: str) -> tuple[float, float]:
+    async def _send(self, chat_id: int | str, text: str) -> None:
         """
-        Expands a shortened Google Maps URL and extracts coordinates.
+        Send text message to one chat.
 
         Args:
-            short_url (str): The shortened Google Maps URL.
-
-        Returns:
-            tuple[float, float]: A tuple containing the latitude and longitude.
+            chat_id (int | str): Telegram chat ID.
+            text (str): Message text.
         """
-        full_url = GoogleMap.get_full_url(short_url)
-        return GoogleMap.extract_coordinates_google_maps(full_url)
+        try:
+            async with self._get_session().post(
+                self._url, json={"chat_id": chat_id, "text": text}
+            ) as response:
+                if response.status != 200:
+                    logger.error(
+                        "Notification to %s failed: %s", chat_id, await response.text()
+                    )
+        except aiohttp.ClientError as ex:
+            logger.error("Error while sending notification to %s: %s", chat_id, ex)
 
-    def get_coordinates_from_link(self, url: str) -> Any | None:
-        item_coordinates = None
-        if url.startswith("https://"):
-            if len(url) < 70:
-                item_coordinates = self.get_coordinates_from_short_url(url)
-            else:
-                item_coordinates = self.extract_coordinates_google_maps(url)
+    async def send_notification(
+        self, payload: dict, old_payload: dict | None, manager_id: Any
+    ) -> NoReturn:
+        """
+        Send notification about saved place card to every chat from chat_ids.
 
-        return item_coordinates
+        Args:
+            payload (dict): New values of the place card.
+            old_payload (dict | None): Values before saving, None for a new card.
+            manager_id (telegram.User): User who saved the place card.
+        """
+        text = self.format_message(payload, old_payload, manager_id)
+        await asyncio.gather(*(self._send(chat_id, text) for chat_id in self.chat_ids))
 
-    def radius_list(
-        self, longitude: float, latitude: float, radius: float, photo: str
-    ) -> list | None:
+    async def close(self) -> NoReturn:
         """
-        Forming a venue list by radius, coordinates and photo existence.
-        Args:
-        longitude (float): part of user coordinates.
-        latitude (float): part of user coordinates.
-        radius (float): radius value around of user.
-        photo (str): collecting parameter for this method, meaning return places with(out) photography.
-        """
-        radius_list = []
-        user_coordinates = (longitude, latitude)
-
-        places = get_maps_filtered_rows()
-        for place in places:
-            if place.coordinates and place.coordinates != "Bad url":
-                place_coordinates = place.coordinates.replace(",", "").split()
-                long, lat = [float(coord) for coord in place_coordinates]
-                distance = haversine(user_coordinates, (long, lat))
-                if distance <= radius:
-                    if photo == "True":
-                        if place.photo:
-                            radius_list.append(
-                                {
-                                    "place_name": place.Name,
-                                    "distance": distance,
-                                    "id": place.ID,
-                                }
-                            )
-                    elif photo == "False":
-                        if not place.photo:
-                            radius_list.append(
-                                {
-                                    "place_name": place.Name,
-                                    "distance": distance,
-                                    "id": place.ID,
-                                }
-                            )
-
-        if radius_list:
-            radius_list.sort(key=lambda x: x["distance"])
-            for place in radius_list:
-                name = place["place_name"]
-                distance = place["distance"]
-
-                if distance < 1:
-                    distance = round(distance, 3)
-                    message_distance = f"{distance * 1000} m"
-                else:
-                    distance = round(distance, 2)
-                    message_distance = f"{distance} km"
-
-                place.update({"message": f"{name} - {message_distance}"})
-            return radius_list
-        else:
-            return None
+        Close the shared aiohttp session.
+        """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
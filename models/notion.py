@@ -1,26 +1,90 @@
+import asyncio
 import logging
-import re
-from typing import Any, Dict, List
-from urllib.parse import urlparse
-import requests
-from notion_client import Client
-from notion_client.helpers import collect_paginated_api
-from config import NOTION_API_ID, NOTION_DATABASE_ID
-import schedule
 import time
-from sqlalchemy.orm import sessionmaker, Session as SQLAlchemySession
-from sqlalchemy import create_engine
-from config import mysql_db_path
+from concurrent.futures import ThreadPoolExecutor
+from cachetools import LRUCache
+from typing import Any, Callable, Dict, Iterator, List, NoReturn, Optional, Set
+import httpx
+from notion_client import APIErrorCode, APIResponseError, Client
+from config import NOTION_API_ID, NOTION_DATABASE_ID
+from sqlalchemy.orm import Session as SQLAlchemySession
+from sqlalchemy import insert, update
 
 # from core.db_functions import put_coordinates
+from core.db import LocalSession
 from core.model import ModelPlaceCard
 
-# from models.google_services import GoogleMap
+from models.google_services import GoogleMap
 
 # Configure logging
 logging.basicConfig(
-    level=logging.DEBUG, format="%(asctime)s - %(levelname)s - %(message)s"
+    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
 )
+logger = logging.getLogger(__name__)
+
+
+# Concurrent HEAD requests when expanding short links, one pooled connection each
+_URL_WORKERS = 10
+# Seconds allowed for a short link to resolve through its redirect chain
+_URL_TIMEOUT = 10
+# Concurrent page writes when syncing to Notion, the API averages 3 requests/s
+_NOTION_WORKERS = 3
+# Attempts per page write before a rate-limited request is given up
+_RATE_LIMIT_RETRIES = 5
+# Expanded short links kept between sync passes
+_URL_CACHE_SIZE = 4096
+
+
+# Query order matching the insertion order of the local table
+OLDEST_FIRST = [{"timestamp": "created_time", "direction": "ascending"}]
+
+
+def _rich_text(value: Any) -> Dict[str, Any]:
+    """Builds a rich_text property holding the value as a string."""
+    return {"rich_text": [{"type": "text", "text": {"content": str(value)}}]}
+
+
+# Notion property builders for the known columns
+_FORMATTERS: Dict[str, Callable[[Any], Dict[str, Any]]] = {
+    "Name": lambda value: {"title": [{"type": "text", "text": {"content": value}}]},
+    "Photo Google Drive": lambda value: {"url": value},
+    "Google Map": lambda value: {"url": value},
+    "Type": lambda value: {"select": {"name": value}},
+    **dict.fromkeys(
+        ("Phone Number", "WhatsApp Number", "Hours of Operation", "Owner / Manager"),
+        _rich_text,
+    ),
+}
+
+
+def _format_by_type(value: Any) -> Dict[str, Any]:
+    """Builds a Notion property for any other column from the Python type of its value."""
+    if isinstance(value, list):
+        return {"multi_select": [{"name": val} for val in value]}
+    if isinstance(value, bool):
+        return {"checkbox": value}
+    if isinstance(value, int):
+        return {"number": value}
+    if isinstance(value, dict):
+        return {"select": {"name": value["name"]}}
+    return _rich_text(value)
+
+
+def _is_short_url(url: str) -> bool:
+    """Short maps.app.goo.gl links carry no coordinates and must be expanded."""
+    return url.startswith("https://") and len(url) < 70
+
+
+def _column_values(place_card: ModelPlaceCard) -> Dict[str, Any]:
+    """Returns the column values set on a transient place card, for a bulk insert.
+
+    Unset columns are left out so their defaults apply as with session.add.
+    """
+    return {
+        column.key: place_card.__dict__[column.key]
+        for column in ModelPlaceCard.__mapper__.column_attrs
+        if column.key in place_card.__dict__
+    }
 
 
 class Notion:
@@ -33,55 +97,81 @@ class Notion:
         """
         self.client = Client(auth=notion_api_id)
         self.database_id = notion_database_id
-        logging.info("Initialized Notion client with API ID and database ID.")
+        # Keep-alive connections for expanding Google Maps short links
+        self._http = httpx.Client(
+            follow_redirects=True,
+            timeout=_URL_TIMEOUT,
+            limits=httpx.Limits(max_connections=_URL_WORKERS),
+        )
+        # Short link -> full URL, short links never change their target
+        self._full_urls: LRUCache = LRUCache(maxsize=_URL_CACHE_SIZE)
+        # Latest last_edited_time applied from Notion, None until the first full sync
+        self._last_synced_at: Optional[str] = None
+        logger.info("Initialized Notion client with API ID and database ID.")
 
-    def read_all_rows(self) -> List[Dict[str, Any]]:
-        """Reads all rows from the Notion database.
+    def iter_pages(self, **query: Any) -> Iterator[List[Dict[str, Any]]]:
+        """Yields the rows of the Notion database one API page at a time.
 
-        Returns:
-        List[Dict[str, Any]]: A list of dictionaries representing rows in the database.
+        Args:
+            **query: Extra arguments for the database query, e.g. sorts or filter.
+
+        Yields:
+        List[Dict[str, Any]]: The rows of one page of the query results.
         """
-        logging.debug(f"Querying all rows from database ID: {self.database_id}")
-        try:
-            rows = collect_paginated_api(
-                self.client.databases.query, database_id=self.database_id
+        logger.debug("Streaming rows from database ID: %s", self.database_id)
+        next_cursor = None
+        while True:
+            response = self.client.databases.query(
+                database_id=self.database_id, start_cursor=next_cursor, **query
             )
-            logging.info(f"Retrieved {len(rows)} rows from the database.")
-            return rows
-        except Exception as e:
-            logging.error(f"Error reading rows from database: {e}")
-            raise
+            yield response.get("results", [])
+
+            next_cursor = response.get("next_cursor")
+            if not response.get("has_more") or not next_cursor:
+                return
 
     def update_or_insert_row(
-        self, row_id: str, row_data: Dict[str, Any]
+        self,
+        row_id: str,
+        row_data: Dict[str, Any],
+        existing_ids: Optional[Set[str]] = None,
     ) -> Dict[str, Any]:
         """Updates an existing row or inserts a new row into the Notion database.
 
         Args:
             row_id (str): The ID of the row to update or create.
             row_data (Dict[str, Any]): A dictionary where keys are column names and values are data to insert or update.
+            existing_ids (Optional[Set[str]]): IDs of the rows already in the database, read once per
+                sync batch by the caller. When omitted the database is queried.
 
         Returns:
             Dict[str, Any]: The response from the Notion API after creating or updating the row.
         """
-        logging.debug(
-            f"Updating or inserting a row in the database ID: {self.database_id} with ID: {row_id} and data: {row_data}"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Updating or inserting a row in the database ID: %s with ID: %s and data: %s",
+                self.database_id,
+                row_id,
+                row_data,
+            )
         try:
-            rows = self.read_all_rows()
-            existing_row = next((row for row in rows if row["id"] == row_id), None)
+            if existing_ids is None:
+                existing_ids = {row["id"] for rows in self.iter_pages() for row in rows}
+            existing_row = row_id in existing_ids
 
-            properties = {}
-            for column_name, value in row_data.items():
-                properties[column_name] = self.format_property(column_name, value)
+            format_property = self.format_property
+            properties = {
+                column_name: format_property(column_name, value)
+                for column_name, value in row_data.items()
+            }
 
             if existing_row:
                 # Update existing row
-                response = self.client.pages.update(
-                    page_id=row_id, properties=properties
+                response = self._call_with_backoff(
+                    self.client.pages.update, page_id=row_id, properties=properties
                 )
-                logging.info(
-                    f"Updated row in the notion database: {response.get('id')}"
+                logger.info(
+                    "Updated row in the notion database: %s", response.get("id")
                 )
             else:
                 # Create new row
@@ -89,16 +179,38 @@ class Notion:
                     "parent": {"database_id": self.database_id},
                     "properties": properties,
                 }
-                response = self.client.pages.create(**new_row)
-                logging.info(
-                    f"Inserted new row into the notion database: {response.get('id')}"
+                response = self._call_with_backoff(self.client.pages.create, **new_row)
+                logger.info(
+                    "Inserted new row into the notion database: %s", response.get("id")
                 )
 
             return response
         except Exception as e:
-            logging.error(f"Error updating or inserting row into notion database: {e}")
+            logger.error("Error updating or inserting row into notion database: %s", e)
             raise
 
+    @staticmethod
+    def _call_with_backoff(call: Callable[..., Any], **kwargs: Any) -> Any:
+        """
+        Calls a Notion endpoint, waiting out rate-limit responses before retrying.
+
+        Args:
+            call (Callable[..., Any]): The client endpoint, e.g. client.pages.update.
+            **kwargs: Arguments passed to the endpoint.
+
+        Returns:
+            Any: The endpoint response.
+        """
+        for attempt in range(1, _RATE_LIMIT_RETRIES + 1):
+            try:
+                return call(**kwargs)
+            except APIResponseError as e:
+                if e.code != APIErrorCode.RateLimited or attempt == _RATE_LIMIT_RETRIES:
+                    raise
+                retry_after = float(e.headers.get("Retry-After", attempt))
+                logger.warning("Notion rate limit hit, retrying in %ss", retry_after)
+                time.sleep(retry_after)
+
     def format_property(self, column_name: str, value: Any) -> Dict[str, Any]:
         """Formats a property for insertion into Notion.
 
@@ -109,53 +221,59 @@ class Notion:
         Returns:
             Dict[str, Any]: The formatted property.
         """
-        logging.debug(
-            f"Formatting property for column: {column_name} with value: {value}"
+        logger.debug(
+            "Formatting property for column: %s with value: %s", column_name, value
         )
-        if column_name == "Name":
-            return {"title": [{"type": "text", "text": {"content": value}}]}
-        elif column_name == "Photo Google Drive" or column_name == "Google Map":
-            return {"url": value}
-
-        elif column_name == "Type":
-            return {"select": {"name": value}}
-
-        elif (
-            column_name == "Phone Number"
-            or column_name == "WhatsApp Number"
-            or column_name == "Hours of Operation"
-            or column_name == "Phone Number"
-            or column_name == "Owner / Manager"
-        ):
-            return {"rich_text": [{"type": "text", "text": {"content": str(value)}}]}
-
-        elif isinstance(value, str):
-            return {"rich_text": [{"type": "text", "text": {"content": value}}]}
-        elif isinstance(value, list):
-            return {"multi_select": [{"name": val} for val in value]}
-        elif isinstance(value, bool):
-            return {"checkbox": value}
-        elif isinstance(value, int):
-            return {"number": value}
-        elif isinstance(value, dict):
-            return {"select": {"name": value["name"]}}
-        else:
-            return {"rich_text": [{"type": "text", "text": {"content": str(value)}}]}
-
-    def sync(self) -> None:
+        formatter = _FORMATTERS.get(column_name)
+        if formatter is not None:
+            return formatter(value)
+        return _format_by_type(value)
+
+    async def sync(self) -> NoReturn:
         """
         Start the synchronization process.
-        This function sets up a scheduled task to run every 30 seconds.
+        Pushes local changes to Notion every 15 seconds and pulls Notion changes every 30 seconds.
+        The HTTP clients are closed when the sync is cancelled.
+        """
+        logger.info("Start sync")
+        # The pooled session factory shared with the bot
+        Session = LocalSession
+        # Both tasks touch is_new/is_updated, they never run at the same time
+        lock = asyncio.Lock()
+        try:
+            await asyncio.gather(
+                self._run_every(15, self._scheduled_task_to_Notion, Session, lock),
+                self._run_every(30, self._scheduled_task_from_Notion, Session, lock),
+            )
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Closes the connections of the Notion API client and the short link client."""
+        self._http.close()
+        self.client.close()
+        logger.info("Closed Notion clients")
+
+    @staticmethod
+    async def _run_every(
+        seconds: int,
+        task: Callable[[SQLAlchemySession], None],
+        Session: SQLAlchemySession,
+        lock: asyncio.Lock,
+    ) -> NoReturn:
+        """
+        Runs a blocking sync task in a worker thread, waiting the interval after each run.
+
+        Args:
+        seconds (int): Pause before each run.
+        task (Callable[[SQLAlchemySession], None]): The sync task.
+        Session (SQLAlchemySession): The SQLAlchemy session factory.
+        lock (asyncio.Lock): Lock shared by the sync tasks.
         """
-        logging.info("Start sync")
-        engine = create_engine(mysql_db_path)
-        Session = sessionmaker(bind=engine)
-        schedule.every(15).seconds.do(self._scheduled_task_to_Notion, Session=Session)
-        schedule.every(30).seconds.do(self._scheduled_task_from_Notion, Session=Session)
-        logging.info("End sync")
         while True:
-            schedule.run_pending()
-            time.sleep(1)
+            await asyncio.sleep(seconds)
+            async with lock:
+                await asyncio.to_thread(task, Session=Session)
 
     def _scheduled_task_to_Notion(self, Session: SQLAlchemySession) -> None:
         """
@@ -166,36 +284,64 @@ class Notion:
         Args:
         Session (SQLAlchemySession): The SQLAlchemy session factory.
         """
-        logging.info("Sync to Notion task started")
+        logger.info("Sync to Notion task started")
         try:
-            session = Session()
-            rows = (
-                session.query(ModelPlaceCard)
-                .filter(
-                    (ModelPlaceCard.is_new == True)
-                    | (ModelPlaceCard.is_updated == True)
+            with Session() as session, session.begin():
+                rows = (
+                    session.query(ModelPlaceCard)
+                    .filter(
+                        (ModelPlaceCard.is_new == True)
+                        | (ModelPlaceCard.is_updated == True)
+                    )
+                    .all()
                 )
-                .all()
-            )
-            if rows:
-                for row in rows:
-
-                    response = self.update_or_insert_row(row.id_page, row.to_dict())
-                    if isinstance(response, Dict):
-                        row.is_new = False
-                        row.is_updated = False
-                        session.add(row)
-                    else:
-                        logging.info("update_or_insert_row failed")
+                if rows:
+                    # One read of the Notion database for the whole batch
+                    existing_ids = {
+                        row["id"] for rows in self.iter_pages() for row in rows
+                    }
+
+                    def push_row(page_id: str, data: Dict[str, Any]) -> Dict | None:
+                        # A failed row must not abort the pass, the others are already written
+                        try:
+                            return self.update_or_insert_row(
+                                page_id, data, existing_ids
+                            )
+                        except Exception:
+                            return None
+
+                    synced_ids = []
+                    # Page writes are latency-bound, a few in flight keep up with the rate limit
+                    with ThreadPoolExecutor(max_workers=_NOTION_WORKERS) as executor:
+                        # ORM rows stay on this thread, workers only get plain data
+                        responses = executor.map(
+                            push_row,
+                            [row.id_page for row in rows],
+                            [row.to_dict() for row in rows],
+                        )
+                        for row, response in zip(rows, responses):
+                            if isinstance(response, Dict):
+                                synced_ids.append(row.id_key)
+                            else:
+                                logger.info(
+                                    "update_or_insert_row failed for %s", row.id_key
+                                )
 
-            else:
-                logging.info("No changes to sync to Notion")
+                    # Status of all synced rows is reset in a single UPDATE
+                    if synced_ids:
+                        session.execute(
+                            update(ModelPlaceCard)
+                            .where(ModelPlaceCard.id_key.in_(synced_ids))
+                            .values(is_new=False, is_updated=False),
+                            execution_options={"synchronize_session": False},
+                        )
 
-            session.commit()
-            session.close()
-            logging.info("Sync to Notion task completed")
+                else:
+                    logger.info("No changes to sync to Notion")
+
+            logger.info("Sync to Notion task completed")
         except Exception as e:
-            logging.error(f"Error in scheduled task from Notion: {e}")
+            logger.error("Error in scheduled task to Notion: %s", e)
 
     def get_full_url(self, short_url: str) -> str:
         """
@@ -207,35 +353,40 @@ class Notion:
         Returns:
             str: The expanded URL.
         """
-        response = requests.head(short_url, allow_redirects=True)
-        return response.url
+        full_url = self._full_urls.get(short_url)
+        if full_url is None:
+            full_url = str(self._http.head(short_url).url)
+            self._full_urls[short_url] = full_url
+        return full_url
 
-    def extract_coordinates_google_maps(self, url: str) -> tuple[float, float] | None:
+    def _prefetch_full_urls(self, urls: Set[str]) -> None:
         """
-        Extracts coordinates from a full Google Maps URL.
+        Expands the short links among the given URLs that are not cached yet, concurrently.
 
-        Args:
-            url (str): The Google Maps URL.
+        Links that fail here are left out and retried inline by get_full_url.
 
-        Returns:
-            tuple[float, float]: A tuple containing the latitude and longitude.
+        Args:
+            urls (Set[str]): Google Maps links of the current sync pass.
         """
-        coordinates = []
-        regex_pattern = r"(-?\d{1,2}\.\d{6}),(-?\d{1,2}\.\d{6})"
-        parsed_url = urlparse(url)
 
-        # Extract coordinates from the URL
-        path_parts = parsed_url.path.split("/")
-        for part in path_parts:
-            if "@" in part:
-                coordinates = part.split("@")[1].split(",")[:2]
-            elif re.match(regex_pattern, part):
-                coordinates = part.split(",")
-
-            if coordinates:
-                return float(coordinates[0]), float(coordinates[1])
-
-        return None
+        def expand(short_url: str) -> str | None:
+            try:
+                return str(self._http.head(short_url).url)
+            except httpx.HTTPError as e:
+                logger.warning("Could not expand %s: %s", short_url, e)
+                return None
+
+        short_urls = [
+            url for url in urls if _is_short_url(url) and url not in self._full_urls
+        ]
+        if not short_urls:
+            return
+        with ThreadPoolExecutor(max_workers=_URL_WORKERS) as executor:
+            for short_url, full_url in zip(
+                short_urls, executor.map(expand, short_urls)
+            ):
+                if full_url:
+                    self._full_urls[short_url] = full_url
 
     def get_coordinates_from_short_url(self, short_url: str) -> tuple[float, float]:
         """
@@ -248,7 +399,7 @@ class Notion:
             tuple[float, float]: A tuple containing the latitude and longitude.
         """
         full_url = self.get_full_url(short_url)
-        return self.extract_coordinates_google_maps(full_url)
+        return GoogleMap.extract_coordinates_google_maps(full_url)
 
     def get_coordinates_from_link(self, url: str) -> Any | None:
         """
@@ -260,10 +411,10 @@ class Notion:
         """
         item_coordinates = None
         if url.startswith("https://"):
-            if len(url) < 70:
+            if _is_short_url(url):
                 item_coordinates = self.get_coordinates_from_short_url(url)
             else:
-                item_coordinates = self.extract_coordinates_google_maps(url)
+                item_coordinates = GoogleMap.extract_coordinates_google_maps(url)
 
         return item_coordinates
 
@@ -277,145 +428,165 @@ class Notion:
         Session (SQLAlchemySession): The SQLAlchemy session factory.
 
         This function performs the following steps:
-        1. Reads all rows from Notion.
-        2. Iterates over the rows in reverse order.
+        1. Streams the rows from Notion page by page, oldest first. After the first pass only
+           rows edited since the previous pass are requested.
+        2. Iterates over the rows of each page.
         3. For each row, it checks if a record with the same `id_page` and `is_updated=False` exists in the database.
         4. If such a record exists, it logs the details.
         5. If no such record exists or if an unchanged record is found, it creates a new `ModelPlaceCard` instance.
         6. Updates the `ModelPlaceCard` instance with data from the Notion row.
         7. Sets the `is_updated` field to `True`.
         8. Adds the `ModelPlaceCard` instance to the session.
-        9. Commits the session after processing all rows.
+        9. Commits the session after processing all pages.
         10. Handles any exceptions that occur during the process, logging the error and rolling back the session if necessary.
         """
-        logging.info("Sync from Notion task started")
-        from core.db_functions import search_by_key
-
-        session = Session()
+        logger.info("Sync from Notion task started")
+        from core.db_functions import invalidate_place
+
+        query: Dict[str, Any] = {"sorts": OLDEST_FIRST}
+        if self._last_synced_at:
+            # Notion rounds edit times to the minute, so the boundary minute is re-read
+            query["filter"] = {
+                "timestamp": "last_edited_time",
+                "last_edited_time": {"on_or_after": self._last_synced_at},
+            }
         try:
-            rows = self.read_all_rows()
-            for num in reversed(rows):
-                model_place_card = (
-                    session.query(ModelPlaceCard)
-                    .filter_by(id_page=num["id"], is_updated=False)
-                    .first()
-                )
-                no_change_place_card = (
-                    session.query(ModelPlaceCard)
-                    .filter_by(id_page=num["id"], is_updated=True)
-                    .first()
-                )
-
-                if no_change_place_card:
-                    logging.info(
-                        f"no_change_place_card {no_change_place_card.Name} - {no_change_place_card.id_page}"
+            last_edited = self._last_synced_at
+            applied = 0
+            with Session() as session, session.begin():
+                for rows in self.iter_pages(**query):
+                    applied += self._sync_page(session, rows)
+                    # ISO 8601 UTC timestamps, so string order is time order
+                    page_edited = max(
+                        (row["last_edited_time"] for row in rows), default=None
                     )
-                else:
-                    if not model_place_card:
-                        model_place_card = ModelPlaceCard()
-                        logging.info("model_place_card created")
-                    for keys, values in num.items():
-
-                        if keys == "id":
-                            model_place_card.id_page = values
-                        if keys == "properties":
-                            for key, value in values.items():
-
-                                if key == "Name":
-                                    model_place_card.Name = search_by_key(
-                                        value, "plain_text"
-                                    )
-
-                                if key == "Type":
-                                    model_place_card.type = search_by_key(value, "name")
-
-                                if key == "ID":
-                                    model_place_card.ID = search_by_key(value, "number")
-
-                                if key == "Photo Google Drive":
-                                    model_place_card.photo = search_by_key(value, "url")
-
-                                if key == "Location":
-                                    if value["select"]:
-                                        model_place_card.location = value["select"][
-                                            "name"
-                                        ]
-                                    else:
-                                        model_place_card.location = "Not specified"
-
-                                if key == "Google Map":
-                                    google_map_link = search_by_key(value, "url")
-                                    if model_place_card.google_map != google_map_link:
-                                        if google_map_link:
-                                            model_place_card.google_map = (
-                                                google_map_link
-                                            )
-
-                                        item_coordinates = (
-                                            self.get_coordinates_from_link(
-                                                model_place_card.google_map
-                                            )
-                                        )
-                                        if item_coordinates:
-                                            model_place_card.coordinates = str(
-                                                item_coordinates
-                                            )[1:-2]
-                                            logging.info(
-                                                f"Get coord to {model_place_card.Name}: {item_coordinates}"
-                                            )
-                                        else:
-                                            model_place_card.google_map = (
-                                                google_map_link
-                                            )
-
-                                if key == "Phone Number":
-                                    model_place_card.phone_number = search_by_key(
-                                        value, "plain_text"
-                                    )
-
-                                if key == "WhatsApp Number":
-                                    model_place_card.whatsapp = search_by_key(
-                                        value, "plain_text"
-                                    )
-
-                                if key == "Hours of Operation":
-                                    model_place_card.hours_of_operation = search_by_key(
-                                        value, "plain_text"
-                                    )
-
-                                if key == "Owner / Manager":
-                                    model_place_card.manager_phone_number = (
-                                        search_by_key(value, "plain_text")
-                                    )
-                        if (
-                            not model_place_card.coordinates
-                            and model_place_card.google_map
-                        ):
-                            item_coordinates = None
-                            google_map_link = model_place_card.google_map
-                            try:
-                                item_coordinates = self.get_coordinates_from_link(
-                                    google_map_link
-                                )
-                            except Exception as e:
-                                logging.error(f"Error in item coordinates: {e}")
+                    if page_edited and (
+                        last_edited is None or page_edited > last_edited
+                    ):
+                        last_edited = page_edited
+
+            # Advanced only after the commit, a failed pass is retried from the old cursor
+            self._last_synced_at = last_edited
+            if applied:
+                invalidate_place()
+            logger.info("Sync from Notion task completed")
+        except Exception as e:
+            logger.error("Error in scheduled task from Notion: %s", e)
 
+    def _sync_page(self, session: SQLAlchemySession, rows: List[Dict[str, Any]]) -> int:
+        """
+        Applies one page of Notion rows to the local database.
+
+        Args:
+        session (SQLAlchemySession): The session of the running sync transaction.
+        rows (List[Dict[str, Any]]): The rows of one page of the Notion query.
+
+        Returns:
+        int: The number of local rows inserted or changed.
+        """
+        if not rows:
+            return 0
+        from core.db_functions import NOTION_FIELDS
+
+        # Local rows of these pages, split by whether they have unsynced edits
+        synced_cards, edited_cards = {}, {}
+        for place_card in (
+            session.query(ModelPlaceCard)
+            .filter(ModelPlaceCard.id_page.in_([num["id"] for num in rows]))
+            .order_by(ModelPlaceCard.id_key)
+        ):
+            cards = edited_cards if place_card.is_updated else synced_cards
+            cards.setdefault(place_card.id_page, place_card)
+
+        # Links the loop below may resolve, expanded concurrently up front
+        map_links = set()
+        for num in rows:
+            if num["id"] in edited_cards:
+                continue
+            place_card = synced_cards.get(num["id"])
+            map_property = num.get("properties", {}).get("Google Map")
+            link = NOTION_FIELDS["Google Map"][1](map_property or {})
+            if place_card is None or place_card.google_map != link:
+                map_links.add(link)
+            if place_card is not None and not place_card.coordinates:
+                map_links.add(place_card.google_map)
+        self._prefetch_full_urls({link for link in map_links if link})
+
+        new_rows, changed = [], 0
+        for num in rows:
+            model_place_card = synced_cards.get(num["id"])
+            no_change_place_card = edited_cards.get(num["id"])
+
+            if no_change_place_card:
+                logger.info(
+                    "no_change_place_card %s - %s",
+                    no_change_place_card.Name,
+                    no_change_place_card.id_page,
+                )
+            else:
+                is_new_row = model_place_card is None
+                if is_new_row:
+                    model_place_card = ModelPlaceCard()
+                    logger.info("model_place_card created")
+                model_place_card.id_page = num["id"]
+                for key, value in num.get("properties", {}).items():
+                    field = NOTION_FIELDS.get(key)
+                    if field is None:
+                        continue
+                    attribute, extract = field
+
+                    if key == "Location":
+                        model_place_card.location = extract(value) or "Not specified"
+                    elif key == "Google Map":
+                        google_map_link = extract(value)
+                        if model_place_card.google_map != google_map_link:
+                            if google_map_link:
+                                model_place_card.google_map = google_map_link
+
+                            item_coordinates = self.get_coordinates_from_link(
+                                model_place_card.google_map
+                            )
                             if item_coordinates:
                                 model_place_card.coordinates = str(item_coordinates)[
                                     1:-2
                                 ]
-                                logging.info(
-                                    f"Get coord to new place {model_place_card.Name}: {item_coordinates}"
+                                logger.info(
+                                    "Get coord to %s: %s",
+                                    model_place_card.Name,
+                                    item_coordinates,
                                 )
                             else:
-                                model_place_card.coordinates = "Bad url"
-
-                        session.add(model_place_card)
-
-            session.commit()
-            logging.info("Sync from Notion task completed")
-        except Exception as e:
-            logging.error(f"Error in scheduled task to Notion: {e}")
-            session.rollback()
-        finally:
-            session.close()
+                                model_place_card.google_map = google_map_link
+                    else:
+                        setattr(model_place_card, attribute, extract(value))
+
+                if not model_place_card.coordinates and model_place_card.google_map:
+                    item_coordinates = None
+                    google_map_link = model_place_card.google_map
+                    try:
+                        item_coordinates = self.get_coordinates_from_link(
+                            google_map_link
+                        )
+                    except Exception as e:
+                        logger.error("Error in item coordinates: %s", e)
+
+                    if item_coordinates:
+                        model_place_card.coordinates = str(item_coordinates)[1:-2]
+                        logger.info(
+                            "Get coord to new place %s: %s",
+                            model_place_card.Name,
+                            item_coordinates,
+                        )
+                    else:
+                        model_place_card.coordinates = "Bad url"
+
+                if is_new_row:
+                    new_rows.append(_column_values(model_place_card))
+                elif session.is_modified(model_place_card):
+                    # Rows re-read at the cursor boundary come back unchanged
+                    changed += 1
+
+        # New places go out as one executemany, existing ones are flushed on commit
+        if new_rows:
+            session.execute(insert(ModelPlaceCard), new_rows)
+        return len(new_rows) + changed
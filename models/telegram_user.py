@@ -1,5 +1,8 @@
 from config import id_list
 
+# Authorized user IDs, hashed once for constant-time lookups
+_AUTHORIZED_IDS = frozenset(id_list)
+
 
 class TelegramUser:
     """
@@ -32,7 +35,6 @@ class TelegramUser:
         Returns:
             TelegramUser: An authenticated TelegramUser instance if found, None otherwise.
         """
-        for user in id_list:
-            if user == user_id:
-                return cls(user_id=user_id)
+        if user_id in _AUTHORIZED_IDS:
+            return cls(user_id=user_id)
         return None
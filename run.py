@@ -3,7 +3,6 @@ from config import TOKEN
 from core.db import init_db
 from config import NOTION_API_ID, NOTION_DATABASE_ID
 from models.notion import Notion
-import threading
 
 if __name__ == "__main__":
     """
@@ -15,9 +14,8 @@ if __name__ == "__main__":
     init_db()
 
     Notion_session = Notion(NOTION_API_ID, NOTION_DATABASE_ID)
-    sync_thread = threading.Thread(target=Notion_session.sync)
-    sync_thread.daemon = True
-    sync_thread.start()
 
+    # The Notion sync runs as a task on the bot's event loop
     bot = TelegramBot(TOKEN)
+    bot.run_alongside(Notion_session.sync)
     bot.start_bot()
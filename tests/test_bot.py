@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 from telegram import (
@@ -8,8 +9,9 @@ from telegram import (
     InlineKeyboardButton,
     InlineKeyboardMarkup,
 )
-from bot.telegram_bot import TelegramBot
+from bot.telegram_bot import PerChatUpdateProcessor, TelegramBot, _is_page_button
 from config import TOKEN
+from core.model import ModelPlaceCard
 
 
 @pytest.mark.asyncio
@@ -83,3 +85,161 @@ async def test_start_unauthorized():
         mock_context.bot.send_message.assert_called_once_with(
             chat_id=67890, text="Your ID is not authorized"
         )
+
+
+@pytest.mark.parametrize(
+    "data, expected",
+    [
+        ("page_next", True),
+        ("page_prev", True),
+        ("notion_42", True),
+        ("notion_", False),
+        ("notion_4a", False),
+        ("button_add_pressed", False),
+    ],
+)
+def test_is_page_button(data, expected):
+    assert _is_page_button(data) is expected
+
+
+def _radius_update_and_context():
+    """Radius message update and context of a started location search."""
+    mock_update = MagicMock(callback_query=None)
+    mock_update.message.text = "2"
+    mock_update.message.reply_text = AsyncMock()
+    mock_update.effective_chat.id = 67890
+
+    mock_context = MagicMock()
+    mock_context.bot.send_message = AsyncMock()
+    mock_context.user_data = {"location": (-84.08, 9.93), "photo_status": 0, "page": 0}
+    return mock_update, mock_context
+
+
+@pytest.mark.asyncio
+async def test_take_radius_no_places():
+    mock_update, mock_context = _radius_update_and_context()
+    bot = TelegramBot(token=TOKEN)
+    bot._maps = MagicMock()
+    bot._maps.radius_list.return_value = None
+
+    await bot.take_radius(mock_update, mock_context)
+
+    assert mock_context.user_data["places_list"] == []
+    assert mock_context.user_data["max_page"] == 0
+    mock_context.bot.send_message.assert_called_once_with(
+        chat_id=67890, text="No places around in selected radius, use /cancel_location"
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "places_count, max_page, has_nav_row",
+    [(1, 0, False), (3, 0, False), (4, 1, True), (6, 1, True), (7, 2, True)],
+)
+async def test_take_radius_max_page(places_count, max_page, has_nav_row):
+    mock_update, mock_context = _radius_update_and_context()
+    bot = TelegramBot(token=TOKEN)
+    bot._maps = MagicMock()
+    bot._maps.radius_list.return_value = [
+        {"id": place_id, "message": f"Place {place_id} - 100 m"}
+        for place_id in range(places_count)
+    ]
+
+    await bot.take_radius(mock_update, mock_context)
+
+    assert mock_context.user_data["max_page"] == max_page
+    keyboard = mock_update.message.reply_text.call_args.kwargs[
+        "reply_markup"
+    ].inline_keyboard
+    place_rows = min(places_count, 3)
+    assert len(keyboard) == place_rows + has_nav_row + 1
+
+
+def _chat_update(update_id, chat_id):
+    """Text message update from the given chat."""
+    chat = Chat(id=chat_id, type="private")
+    message = Message(message_id=update_id, date=None, chat=chat, text="2")
+    return Update(update_id=update_id, message=message)
+
+
+@pytest.mark.asyncio
+async def test_update_processor_serializes_chat():
+    processor = PerChatUpdateProcessor(max_concurrent_updates=4)
+    events = []
+    first_started = asyncio.Event()
+    release_first = asyncio.Event()
+
+    async def handle(name, wait=None):
+        events.append(f"{name} start")
+        if wait:
+            first_started.set()
+            await wait.wait()
+        events.append(f"{name} end")
+
+    first = asyncio.create_task(
+        processor.process_update(_chat_update(1, 1), handle("first", release_first))
+    )
+    await first_started.wait()
+    same_chat = asyncio.create_task(
+        processor.process_update(_chat_update(2, 1), handle("same chat"))
+    )
+    await processor.process_update(_chat_update(3, 2), handle("other chat"))
+    release_first.set()
+    await asyncio.gather(first, same_chat)
+
+    assert events == [
+        "first start",
+        "other chat start",
+        "other chat end",
+        "first end",
+        "same chat start",
+        "same chat end",
+    ]
+    assert len(processor._chat_locks) == 0
+
+
+@pytest.mark.asyncio
+async def test_show_place_sends_card_before_prompt():
+    mock_update = MagicMock(callback_query=None)
+    mock_update.message.reply_text = AsyncMock()
+    mock_update.effective_chat.id = 67890
+    mock_context = MagicMock()
+    sent = []
+
+    async def send_message(chat_id, text, **kwargs):
+        await asyncio.sleep(0.01)
+        sent.append("card")
+
+    async def reply_text(text, **kwargs):
+        sent.append("prompt")
+
+    mock_context.bot.send_message = send_message
+    mock_update.message.reply_text = reply_text
+    bot = TelegramBot(token=TOKEN)
+
+    await bot._show_place(mock_context, mock_update, ModelPlaceCard(Name="Cafe"))
+
+    assert sent == ["card", "prompt"]
+
+
+@pytest.mark.asyncio
+async def test_update_processor_busy_chat_does_not_block_others():
+    processor = PerChatUpdateProcessor(max_concurrent_updates=4)
+    finished = []
+
+    async def handle(name, seconds):
+        await asyncio.sleep(seconds)
+        finished.append(name)
+
+    busy_chat = [
+        asyncio.create_task(
+            processor.process_update(_chat_update(update_id, 1), handle("A", 0.05))
+        )
+        for update_id in range(6)
+    ]
+    await asyncio.sleep(0)
+    await processor.process_update(_chat_update(10, 2), handle("B", 0))
+    await asyncio.gather(*busy_chat)
+
+    # Chat B only waits for a free slot, not for the updates queued in chat A
+    assert finished.index("B") == 0
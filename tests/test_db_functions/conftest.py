@@ -1,35 +1,54 @@
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import Engine, create_engine, event
 from sqlalchemy.orm import sessionmaker, Session
 
 from core.model import ModelPlaceCard
 
 
-@pytest.fixture
-def sample_data() -> dict[str, str | dict | list]:
+@pytest.fixture(scope="session")
+def engine() -> Engine:
     """
-    A fixture that provides a sample of data for testing.
+    A fixture that creates the in-memory database once for the whole test run.
     """
 
-    return {
-        "key1": "value1",
-        "key2": {"nested_key": "nested_value"},
-        "key3": [{"inner_key": "inner_value"}],
-    }
+    engine = create_engine("sqlite:///:memory:")
+
+    # pysqlite defers BEGIN on its own, which breaks SAVEPOINT; emit it explicitly
+    @event.listens_for(engine, "connect")
+    def do_connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def do_begin(connection):
+        connection.exec_driver_sql("BEGIN")
+
+    ModelPlaceCard.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
 
 
 @pytest.fixture
-def db_session() -> Session:
+def db_session(engine: Engine) -> Session:
     """
-    A fixture that creates and provides a database session for testing.
+    A fixture that provides a database session for testing.
+
+    The session runs inside an outer transaction that is rolled back after the test,
+    commits made by the code under test only release savepoints.
     """
 
-    engine = create_engine("sqlite:///:memory:")
-    ModelPlaceCard.metadata.create_all(engine)
-    test_session = sessionmaker(bind=engine)
+    connection = engine.connect()
+    transaction = connection.begin()
+    # Same instance behaviour as core.db.LocalSession
+    test_session = sessionmaker(
+        bind=connection,
+        join_transaction_mode="create_savepoint",
+        expire_on_commit=False,
+    )
     session = test_session()
     yield session
     session.close()
+    transaction.rollback()
+    connection.close()
 
 
 @pytest.fixture
@@ -42,20 +61,21 @@ def mock_notion() -> type:
         def __init__(self, *args):
             pass
 
-        def read_all_rows(self):
-            return [
+        def iter_pages(self, **query):
+            yield [
                 {
                     "id": "test_id",
                     "properties": {
-                        "Name": {"plain_text": "Test Company"},
-                        "Type": {"name": "Test Type"},
+                        "Name": {"title": [{"plain_text": "Test Company"}]},
+                        "Type": {"select": {"name": "Test Type"}},
                         "ID": {"number": 1},
                         "Photo Google Drive": {"url": "http://test.com/photo"},
                         "Google Map": {"url": "http://test.com/map"},
-                        "Phone Number": {"plain_text": "123456789"},
-                        "WhatsApp Number": {"plain_text": "987654321"},
-                        "Hours of Operation": {"plain_text": "9-5"},
-                        "Owner / Manager": {"plain_text": "John Doe"},
+                        "Phone Number": {"rich_text": [{"plain_text": "123456789"}]},
+                        "WhatsApp Number": {"rich_text": [{"plain_text": "987654321"}]},
+                        "Hours of Operation": {"rich_text": [{"plain_text": "9-5"}]},
+                        "Owner / Manager": {"rich_text": [{"plain_text": "John Doe"}]},
+                        "Location": {"select": None},
                     },
                 }
             ]
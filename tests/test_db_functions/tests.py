@@ -1,45 +1,73 @@
 import pytest
 from sqlalchemy.orm import Session
 
-from config import NOTION_API_ID, NOTION_DATABASE_ID
+from bot.telegram_bot import TelegramBot
+from config import NOTION_API_ID, NOTION_DATABASE_ID, TOKEN
 from core.db_functions import (
+    NOTION_FIELDS,
+    _notion_row_to_dict,
     find_company_by_name,
-    search_by_key,
+    get_place_by_id,
+    invalidate_place,
+    put_coordinates,
     update_database_from_notion,
 )
 from core.model import ModelPlaceCard
 
 
-class TestSearchByKey:
+class TestNotionFields:
     """
-    Testing the search_by_key function
+    Testing the Notion property extractors and _notion_row_to_dict
     """
 
-    def test_search_by_key_dict(
-        self, sample_data: dict[str, str | dict | list]
-    ) -> None:
-        """
-        Searching in the dictionary
-        """
-
-        assert search_by_key(sample_data, "key1") == "value1"
-        assert search_by_key(sample_data, "nested_key") == "nested_value"
-
-    def test_search_by_key_list(self, sample_data: dict[str, str | dict | list]):
-        """
-        Searching in a list of dictionaries
-        """
-
-        assert search_by_key(sample_data, "inner_key") == "inner_value"
-
-    def test_search_by_key_non_existing_key(
-        self, sample_data: dict[str, str | dict | list]
-    ):
-        """
-        Searching for a non-existent key
-        """
-
-        assert search_by_key(sample_data, "non_existing_key") is None
+    @pytest.mark.parametrize(
+        "key, value, expected",
+        [
+            ("Name", {"title": [{"plain_text": "Cafe"}]}, ("Name", "Cafe")),
+            ("Name", {"title": []}, ("Name", None)),
+            ("Type", {"select": {"name": "Restaurant"}}, ("type", "Restaurant")),
+            ("Location", {"select": None}, ("location", None)),
+            ("ID", {"number": 7}, ("ID", 7)),
+            (
+                "Google Map",
+                {"url": "http://test.com/map"},
+                ("google_map", "http://test.com/map"),
+            ),
+            (
+                "WhatsApp Number",
+                {"rich_text": [{"plain_text": "111"}, {"plain_text": "222"}]},
+                ("whatsapp", "111"),
+            ),
+            ("Hours of Operation", {"rich_text": []}, ("hours_of_operation", None)),
+        ],
+    )
+    def test_notion_fields(self, key: str, value: dict, expected: tuple):
+        attribute, extract = NOTION_FIELDS[key]
+
+        assert (attribute, extract(value)) == expected
+
+    def test_notion_row_to_dict(self):
+        row = {
+            "id": "page_id",
+            "properties": {
+                "Name": {"title": [{"plain_text": "Cafe"}]},
+                "Phone Number": {"rich_text": [{"plain_text": "123"}]},
+                "Unknown": {"checkbox": True},
+            },
+        }
+
+        place_card = _notion_row_to_dict(row)
+
+        assert place_card["id_page"] == "page_id"
+        assert place_card["Name"] == "Cafe"
+        assert place_card["phone_number"] == "123"
+        # Missing properties default to "", unknown ones are skipped
+        assert place_card["type"] == ""
+        assert "Unknown" not in place_card
+        assert set(place_card) == {
+            "id_page",
+            *(attribute for attribute, _ in NOTION_FIELDS.values()),
+        }
 
 
 class TestUpdateDatabaseFromNotion:
@@ -52,12 +80,7 @@ class TestUpdateDatabaseFromNotion:
     ):
         # Substitution of dependencies
         monkeypatch.setattr("core.db_functions.Notion", mock_notion)
-        monkeypatch.setattr(
-            "core.db_functions.create_engine", lambda x: db_session.bind
-        )
-        monkeypatch.setattr(
-            "core.db_functions.sessionmaker", lambda bind: lambda: db_session
-        )
+        monkeypatch.setattr("core.db_functions.LocalSession", lambda: db_session)
 
         update_database_from_notion(NOTION_API_ID, NOTION_DATABASE_ID)
 
@@ -96,12 +119,7 @@ class TestFindCompanyByName:
             db_session.commit()
 
         # Substitution of dependencies
-        monkeypatch.setattr(
-            "core.db_functions.create_engine", lambda x: db_session.bind
-        )
-        monkeypatch.setattr(
-            "core.db_functions.sessionmaker", lambda bind: lambda: db_session
-        )
+        monkeypatch.setattr("core.db_functions.LocalSession", lambda: db_session)
 
         result = find_company_by_name(company_name)
 
@@ -110,3 +128,39 @@ class TestFindCompanyByName:
         assert (
             db_session.query(ModelPlaceCard).filter_by(Name=company_name).count() == 1
         )
+
+
+class TestPlaceCache:
+    """
+    Testing that get_place_by_id serves fresh data after a card is changed
+    """
+
+    @pytest.fixture(autouse=True)
+    def cached_card(self, db_session: Session, monkeypatch) -> None:
+        # Substitution of dependencies
+        monkeypatch.setattr("core.db_functions.LocalSession", lambda: db_session)
+        monkeypatch.setattr("bot.telegram_bot.get_db", lambda: db_session)
+
+        db_session.add(ModelPlaceCard(ID="7", Name="Cafe"))
+        db_session.commit()
+        invalidate_place()
+        yield
+        invalidate_place()
+
+    def test_put_coordinates(self, db_session: Session):
+        card = get_place_by_id("7")
+        assert card.coordinates == ""
+
+        put_coordinates(card, (9.9281, -84.0907))
+
+        stored = db_session.query(ModelPlaceCard).filter_by(ID="7").one()
+        assert stored.coordinates
+        assert get_place_by_id("7").coordinates == stored.coordinates
+
+    def test_save_place_card(self):
+        card = get_place_by_id("7")
+        card.Name = "New Cafe"
+
+        TelegramBot(token=TOKEN)._save_place_card(card)
+
+        assert get_place_by_id("7").Name == "New Cafe"
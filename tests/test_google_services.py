@@ -0,0 +1,28 @@
+import pytest
+from models.google_services import GoogleMap
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        (
+            "https://www.google.com/maps/place/Cafe/@9.9281,-84.0907,17z/data=!3m1",
+            (9.9281, -84.0907),
+        ),
+        ("https://www.google.com/maps/@-33.8688,151.2093,15z", (-33.8688, 151.2093)),
+        ("https://www.google.com/maps/@10,-84,12z", (10.0, -84.0)),
+        (
+            "https://www.google.com/maps/search/9.928100,-84.090700",
+            (9.9281, -84.0907),
+        ),
+        (
+            "https://www.google.com/maps/place/9.928100,-84.090700/@9.93,-84.09,17z",
+            (9.9281, -84.0907),
+        ),
+        ("https://www.google.com/maps/place/Cafe+San+Jose", None),
+        ("https://www.google.com/maps?q=9.928100,-84.090700", None),
+    ],
+)
+def test_extract_coordinates_google_maps(url, expected):
+    """Coordinates come from the first "@lat,lng" part or "lat,lng" segment of the path."""
+    assert GoogleMap.extract_coordinates_google_maps(url) == expected
@@ -0,0 +1,30 @@
+from core.model import ModelPlaceCard
+
+
+def test_to_dict_exports_filled_fields():
+    """to_dict exports the filled Notion fields under their Notion names."""
+    place_card = ModelPlaceCard(
+        Name="Cafe",
+        ID="7",
+        id_page="page_id",
+        type="Restaurant",
+        photo="",
+        location="San Jose",
+        google_map="https://maps.app.goo.gl/abc",
+        phone_number="+50612345678",
+        coordinates="9.93, -84.08",
+        is_updated=True,
+    )
+
+    assert place_card.to_dict() == {
+        "Name": "Cafe",
+        "Type": "Restaurant",
+        "Google Map": "https://maps.app.goo.gl/abc",
+        "Phone Number": "+50612345678",
+        "Location": "San Jose",
+    }
+
+
+def test_to_dict_empty_card():
+    """A card without values exports nothing."""
+    assert ModelPlaceCard().to_dict() == {}
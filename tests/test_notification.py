@@ -0,0 +1,63 @@
+import pytest
+from unittest.mock import AsyncMock
+from telegram import User
+
+from models.notification import NotificationSender
+
+
+@pytest.fixture
+def sender():
+    """NotificationSender with two recipients."""
+    return NotificationSender(token="123:abc", chat_ids=[1, 2])
+
+
+@pytest.fixture
+def manager():
+    """Telegram user who saves the place card."""
+    return User(id=12345, first_name="Test", last_name="Manager", is_bot=False)
+
+
+def test_format_message_new_card(sender, manager):
+    """A new card lists every filled field."""
+    payload = {"Name": "Cafe", "type": "Restaurant", "photo": "", "location": None}
+
+    text = sender.format_message(payload, None, manager)
+
+    assert text == "Test Manager added place card Cafe\nName: Cafe\nType: Restaurant"
+
+
+def test_format_message_updated_card(sender, manager):
+    """An updated card lists only the changed fields with old and new values."""
+    old_payload = {"Name": "Cafe", "type": "Restaurant", "whatsapp": "111"}
+    payload = {"Name": "Cafe", "type": "Restaurant", "whatsapp": "222"}
+
+    text = sender.format_message(payload, old_payload, manager)
+
+    assert text == "Test Manager updated place card Cafe\nWhatsApp: 111 -> 222"
+
+
+@pytest.mark.asyncio
+async def test_send_notification_to_every_chat(sender, manager):
+    """The same text is sent once to each recipient."""
+    sender._send = AsyncMock()
+
+    await sender.send_notification({"Name": "Cafe"}, None, manager)
+
+    text = "Test Manager added place card Cafe\nName: Cafe"
+    assert [call.args for call in sender._send.await_args_list] == [
+        (1, text),
+        (2, text),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_session_reused_until_closed(sender):
+    """One HTTP session serves all notifications and is closed by close()."""
+    session = sender._get_session()
+    assert sender._get_session() is session
+
+    await sender.close()
+
+    assert session.closed
+    assert sender._get_session() is not session
+    await sender.close()
@@ -0,0 +1,184 @@
+import asyncio
+import pytest
+from unittest.mock import MagicMock, patch
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from core.model import ModelPlaceCard
+from models.notion import Notion
+
+
+@pytest.fixture
+def notion():
+    """Notion wrapper with real, unused HTTP clients."""
+    return Notion("secret_token", "database_id")
+
+
+@pytest.mark.asyncio
+async def test_sync_closes_clients_when_cancelled(notion):
+    sync = asyncio.create_task(notion.sync())
+    await asyncio.sleep(0)
+
+    sync.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await sync
+
+    assert notion._http.is_closed
+    assert notion.client.client.is_closed
+
+
+def _page(page_id, last_edited_time):
+    """Notion page with no properties."""
+    return {"id": page_id, "last_edited_time": last_edited_time, "properties": {}}
+
+
+@pytest.fixture
+def session_factory():
+    """Session factory whose session commits on leaving session.begin()."""
+    return MagicMock()
+
+
+@pytest.fixture
+def synced_notion(notion):
+    """Notion wrapper with mocked query results and page sync."""
+    notion.iter_pages = MagicMock(
+        return_value=iter(
+            [
+                [_page("a", "2024-05-01T10:05:00.000Z")],
+                [_page("b", "2024-05-02T08:00:00.000Z")],
+                [_page("c", "2024-04-30T12:00:00.000Z")],
+            ]
+        )
+    )
+    # Every page changes one local row
+    notion._sync_page = MagicMock(return_value=1)
+    return notion
+
+
+def test_from_notion_first_pass_sets_cursor(synced_notion, session_factory):
+    with patch("core.db_functions.invalidate_place") as invalidate_place:
+        synced_notion._scheduled_task_from_Notion(session_factory)
+
+    assert "filter" not in synced_notion.iter_pages.call_args.kwargs
+    assert synced_notion._sync_page.call_count == 3
+    # Latest edit over all pages, not the edit time of the last page
+    assert synced_notion._last_synced_at == "2024-05-02T08:00:00.000Z"
+    invalidate_place.assert_called_once_with()
+
+
+def test_from_notion_queries_edits_since_cursor(synced_notion, session_factory):
+    synced_notion._last_synced_at = "2024-04-01T00:00:00.000Z"
+
+    synced_notion._scheduled_task_from_Notion(session_factory)
+
+    assert synced_notion.iter_pages.call_args.kwargs["filter"] == {
+        "timestamp": "last_edited_time",
+        "last_edited_time": {"on_or_after": "2024-04-01T00:00:00.000Z"},
+    }
+    assert synced_notion._last_synced_at == "2024-05-02T08:00:00.000Z"
+
+
+def test_from_notion_unchanged_pass_keeps_cache(synced_notion, session_factory):
+    synced_notion._last_synced_at = "2024-05-02T08:00:00.000Z"
+    synced_notion._sync_page.return_value = 0
+
+    with patch("core.db_functions.invalidate_place") as invalidate_place:
+        synced_notion._scheduled_task_from_Notion(session_factory)
+
+    assert synced_notion._sync_page.call_count == 3
+    invalidate_place.assert_not_called()
+
+
+def test_sync_page_counts_only_changed_rows(notion):
+    engine = create_engine("sqlite:///:memory:")
+    ModelPlaceCard.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    page = {"id": "a", "last_edited_time": "", "properties": {}}
+
+    with Session() as session, session.begin():
+        assert notion._sync_page(session, [page]) == 1
+    # The boundary minute is re-read on the next pass without any edit
+    with Session() as session, session.begin():
+        assert notion._sync_page(session, [page]) == 0
+    engine.dispose()
+
+
+def test_from_notion_keeps_cursor_when_commit_fails(synced_notion, session_factory):
+    synced_notion._last_synced_at = "2024-04-01T00:00:00.000Z"
+    session = session_factory.return_value.__enter__.return_value
+    session.begin.return_value.__exit__.side_effect = RuntimeError("commit failed")
+
+    with patch("core.db_functions.invalidate_place") as invalidate_place:
+        synced_notion._scheduled_task_from_Notion(session_factory)
+
+    assert synced_notion._sync_page.call_count == 3
+    assert synced_notion._last_synced_at == "2024-04-01T00:00:00.000Z"
+    invalidate_place.assert_not_called()
+
+
+def test_from_notion_keeps_cursor_when_page_fails(synced_notion, session_factory):
+    synced_notion._sync_page.side_effect = [1, RuntimeError("bad page")]
+
+    synced_notion._scheduled_task_from_Notion(session_factory)
+
+    assert synced_notion._last_synced_at is None
+
+
+def test_update_or_insert_row_formats_properties(notion):
+    notion.client = MagicMock()
+    notion.client.pages.update.return_value = {"id": "page_id"}
+
+    notion.update_or_insert_row(
+        "page_id", {"Name": "Cafe", "Phone Number": "+50612345678"}, {"page_id"}
+    )
+
+    notion.client.pages.update.assert_called_once_with(
+        page_id="page_id",
+        properties={
+            "Name": notion.format_property("Name", "Cafe"),
+            "Phone Number": notion.format_property("Phone Number", "+50612345678"),
+        },
+    )
+    assert notion.format_property("Name", "Cafe") == {
+        "title": [{"type": "text", "text": {"content": "Cafe"}}]
+    }
+
+
+def test_to_notion_resets_only_synced_rows(notion):
+    engine = create_engine("sqlite:///:memory:")
+    ModelPlaceCard.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    with Session() as session, session.begin():
+        session.add_all(
+            [
+                ModelPlaceCard(Name="Cafe", is_new=True),
+                ModelPlaceCard(Name="Bar", is_new=True),
+                ModelPlaceCard(Name="Shop", is_updated=True),
+            ]
+        )
+
+    def update_or_insert_row(page_id, data, existing_ids):
+        if data["Name"] == "Bar":
+            raise RuntimeError("Notion is down")
+        return {"id": data["Name"]}
+
+    notion.iter_pages = MagicMock(return_value=iter([]))
+    notion.update_or_insert_row = MagicMock(side_effect=update_or_insert_row)
+
+    notion._scheduled_task_to_Notion(Session)
+
+    with Session() as session:
+        dirty = session.query(ModelPlaceCard.Name).filter(
+            ModelPlaceCard.is_new | ModelPlaceCard.is_updated
+        )
+        assert [name for (name,) in dirty] == ["Bar"]
+
+    # The next pass retries only the failed row
+    notion.iter_pages.return_value = iter([])
+    notion.update_or_insert_row.reset_mock()
+    notion._scheduled_task_to_Notion(Session)
+
+    assert [
+        call.args[1]["Name"] for call in notion.update_or_insert_row.call_args_list
+    ] == ["Bar"]
+    engine.dispose()